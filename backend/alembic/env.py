@@ -9,7 +9,7 @@ import sys
 from logging.config import fileConfig
 from pathlib import Path
 
-from sqlalchemy import engine_from_config, pool
+from sqlalchemy import engine_from_config, event, pool
 
 from alembic import context
 
@@ -20,6 +20,7 @@ sys.path.insert(0, str(backend_dir))
 # Import our SQLAlchemy models for autogenerate support
 from app.db.sa_models import Base
 from app.core.config import DATABASE_PATH
+from app.db.schema_cache import clear_schema_cache
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -85,6 +86,17 @@ def run_migrations_online() -> None:
         poolclass=pool.NullPool,
     )
 
+    # pysqlite only opens a transaction before DML, so every CREATE/ALTER
+    # would otherwise commit (and sync to disk) on its own. Take over
+    # transaction control so the whole upgrade runs in one transaction.
+    @event.listens_for(connectable, "connect")
+    def _disable_pysqlite_autobegin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(connectable, "begin")
+    def _begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     with connectable.connect() as connection:
         context.configure(
             connection=connection,
@@ -93,10 +105,16 @@ def run_migrations_online() -> None:
             compare_type=True,
             # Render as batch operations for SQLite ALTER TABLE limitations
             render_as_batch=True,
+            # SQLite DDL is transactional once pysqlite stops managing it
+            transactional_ddl=True,
         )
 
-        with context.begin_transaction():
-            context.run_migrations()
+        try:
+            with context.begin_transaction():
+                context.run_migrations()
+        finally:
+            # The schema snapshot is shared by every migration in this run
+            clear_schema_cache(connection)
 
 
 if context.is_offline_mode():
@@ -12,7 +12,8 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy import inspect
+
+from app.db.schema_cache import get_schema_cache
 
 
 # revision identifiers, used by Alembic.
@@ -22,51 +23,26 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
-def table_exists(table_name: str) -> bool:
-    """Check if a table exists in the database."""
-    bind = op.get_bind()
-    inspector = inspect(bind)
-    return table_name in inspector.get_table_names()
-
-
-def column_exists(table_name: str, column_name: str) -> bool:
-    """Check if a column exists in a table."""
-    bind = op.get_bind()
-    inspector = inspect(bind)
-    columns = [col['name'] for col in inspector.get_columns(table_name)]
-    return column_name in columns
-
-
-def index_exists(table_name: str, index_name: str) -> bool:
-    """Check if an index exists."""
-    bind = op.get_bind()
-    inspector = inspect(bind)
-    indexes = [idx['name'] for idx in inspector.get_indexes(table_name)]
-    return index_name in indexes
-
-
 def upgrade() -> None:
     """Upgrade schema."""
+    schema = get_schema_cache(op.get_bind())
     # Create users table if it doesn't exist
-    if not table_exists('users'):
-        op.create_table(
-            'users',
-            sa.Column('user_id', sa.String(), nullable=False),
-            sa.Column('email', sa.String(), nullable=False),
-            sa.Column('hashed_password', sa.String(), nullable=False),
-            sa.Column('created_at', sa.String(), nullable=False),
-            sa.Column('is_active', sa.Integer(), nullable=False, server_default='1'),
-            sa.PrimaryKeyConstraint('user_id'),
-            sa.UniqueConstraint('email'),
-        )
-    
-    # Add email index if it doesn't exist
-    if table_exists('users') and not index_exists('users', 'ix_users_email'):
-        op.create_index('ix_users_email', 'users', ['email'], unique=True)
+    op.create_table(
+        'users',
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('email', sa.String(), nullable=False),
+        sa.Column('hashed_password', sa.String(), nullable=False),
+        sa.Column('created_at', sa.String(), nullable=False),
+        sa.Column('is_active', sa.Integer(), nullable=False, server_default='1'),
+        sa.PrimaryKeyConstraint('user_id'),
+        sa.UniqueConstraint('email'),
+        if_not_exists=True,
+    )
+    op.create_index('ix_users_email', 'users', ['email'], unique=True, if_not_exists=True)
     
     # Create api_keys table if it doesn't exist
-    if not table_exists('api_keys'):
-        op.create_table(
+    if not schema.has_table('api_keys'):
+        table = op.create_table(
             'api_keys',
             sa.Column('key_id', sa.String(), nullable=False),
             sa.Column('user_id', sa.String(), nullable=False),
@@ -80,22 +56,20 @@ def upgrade() -> None:
             sa.PrimaryKeyConstraint('key_id'),
             sa.UniqueConstraint('user_id', 'provider', name='uix_user_provider'),
         )
+        schema.add_table(table)
     else:
         # Add custom_env_var column if it doesn't exist (for existing databases)
-        if not column_exists('api_keys', 'custom_env_var'):
-            with op.batch_alter_table('api_keys') as batch_op:
-                batch_op.add_column(sa.Column('custom_env_var', sa.String(), nullable=True))
+        if not schema.has_column('api_keys', 'custom_env_var'):
+            op.add_column('api_keys', sa.Column('custom_env_var', sa.String(), nullable=True))
+            schema.add_column('api_keys', 'custom_env_var')
     
     # Add api_keys indexes
-    if table_exists('api_keys'):
-        if not index_exists('api_keys', 'ix_api_keys_user_id'):
-            op.create_index('ix_api_keys_user_id', 'api_keys', ['user_id'], unique=False)
-        if not index_exists('api_keys', 'ix_api_keys_provider'):
-            op.create_index('ix_api_keys_provider', 'api_keys', ['provider'], unique=False)
+    op.create_index('ix_api_keys_user_id', 'api_keys', ['user_id'], unique=False, if_not_exists=True)
+    op.create_index('ix_api_keys_provider', 'api_keys', ['provider'], unique=False, if_not_exists=True)
     
     # Create runs table if it doesn't exist
-    if not table_exists('runs'):
-        op.create_table(
+    if not schema.has_table('runs'):
+        table = op.create_table(
             'runs',
             sa.Column('run_id', sa.String(), nullable=False),
             sa.Column('user_id', sa.String(), nullable=True),
@@ -115,28 +89,23 @@ def upgrade() -> None:
             sa.ForeignKeyConstraint(['user_id'], ['users.user_id']),
             sa.PrimaryKeyConstraint('run_id'),
         )
+        schema.add_table(table)
     else:
         # Add columns that might be missing in existing databases
-        with op.batch_alter_table('runs') as batch_op:
-            if not column_exists('runs', 'primary_metric'):
-                batch_op.add_column(sa.Column('primary_metric', sa.Float(), nullable=True))
-            if not column_exists('runs', 'primary_metric_name'):
-                batch_op.add_column(sa.Column('primary_metric_name', sa.String(), nullable=True))
-            if not column_exists('runs', 'user_id'):
-                batch_op.add_column(sa.Column('user_id', sa.String(), nullable=True))
-            if not column_exists('runs', 'tags_json'):
-                batch_op.add_column(sa.Column('tags_json', sa.Text(), nullable=True, server_default='[]'))
+        missing = schema.missing_columns('runs', (
+            sa.Column('primary_metric', sa.Float(), nullable=True),
+            sa.Column('primary_metric_name', sa.String(), nullable=True),
+            sa.Column('user_id', sa.String(), nullable=True),
+            sa.Column('tags_json', sa.Text(), nullable=True, server_default='[]'),
+        ))
+        for column in missing:
+            op.add_column('runs', column)
+            schema.add_column('runs', column.name)
     
     # Add runs indexes
-    if table_exists('runs'):
-        if not index_exists('runs', 'ix_runs_user_id'):
-            op.create_index('ix_runs_user_id', 'runs', ['user_id'], unique=False)
-        if not index_exists('runs', 'ix_runs_benchmark'):
-            op.create_index('ix_runs_benchmark', 'runs', ['benchmark'], unique=False)
-        if not index_exists('runs', 'ix_runs_model'):
-            op.create_index('ix_runs_model', 'runs', ['model'], unique=False)
-        if not index_exists('runs', 'ix_runs_status'):
-            op.create_index('ix_runs_status', 'runs', ['status'], unique=False)
+    # user_id, status and benchmark lookups use the composite indexes added
+    # in c3d4e5f6g789, which lead with those columns
+    op.create_index('ix_runs_model', 'runs', ['model'], unique=False, if_not_exists=True)
 
 
 def downgrade() -> None:
@@ -10,7 +10,8 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy import inspect
+
+from app.db.schema_cache import get_schema_cache
 
 
 # revision identifiers, used by Alembic.
@@ -20,23 +21,17 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
-def column_exists(table_name: str, column_name: str) -> bool:
-    """Check if a column exists in a table."""
-    bind = op.get_bind()
-    inspector = inspect(bind)
-    columns = [col['name'] for col in inspector.get_columns(table_name)]
-    return column_name in columns
-
-
 def upgrade() -> None:
     """Add notes column to runs table."""
-    if not column_exists('runs', 'notes'):
-        with op.batch_alter_table('runs') as batch_op:
-            batch_op.add_column(sa.Column('notes', sa.Text(), nullable=True))
+    schema = get_schema_cache(op.get_bind())
+    if not schema.has_column('runs', 'notes'):
+        op.add_column('runs', sa.Column('notes', sa.Text(), nullable=True))
+        schema.add_column('runs', 'notes')
 
 
 def downgrade() -> None:
     """Remove notes column from runs table."""
-    if column_exists('runs', 'notes'):
+    schema = get_schema_cache(op.get_bind())
+    if schema.has_column('runs', 'notes'):
         with op.batch_alter_table('runs') as batch_op:
             batch_op.drop_column('notes')
@@ -20,22 +20,16 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Add cost tracking columns to runs table."""
-    # Add input_tokens column
     op.add_column('runs', sa.Column('input_tokens', sa.Integer(), nullable=True))
-    
-    # Add output_tokens column
     op.add_column('runs', sa.Column('output_tokens', sa.Integer(), nullable=True))
-    
-    # Add total_tokens column
     op.add_column('runs', sa.Column('total_tokens', sa.Integer(), nullable=True))
-    
-    # Add estimated_cost column
     op.add_column('runs', sa.Column('estimated_cost', sa.Float(), nullable=True))
 
 
 def downgrade() -> None:
     """Remove cost tracking columns from runs table."""
-    op.drop_column('runs', 'estimated_cost')
-    op.drop_column('runs', 'total_tokens')
-    op.drop_column('runs', 'output_tokens')
-    op.drop_column('runs', 'input_tokens')
+    with op.batch_alter_table('runs') as batch_op:
+        batch_op.drop_column('estimated_cost')
+        batch_op.drop_column('total_tokens')
+        batch_op.drop_column('output_tokens')
+        batch_op.drop_column('input_tokens')
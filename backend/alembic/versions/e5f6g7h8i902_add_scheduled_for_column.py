@@ -17,13 +17,13 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Add scheduled_for column to runs table
+    # Add scheduled_for column to runs table, with an index for efficient
+    # querying of scheduled runs
     op.add_column('runs', sa.Column('scheduled_for', sa.String(), nullable=True))
-    
-    # Create index for efficient querying of scheduled runs
     op.create_index('ix_runs_scheduled_for', 'runs', ['scheduled_for'], unique=False)
 
 
 def downgrade() -> None:
-    op.drop_index('ix_runs_scheduled_for', table_name='runs')
-    op.drop_column('runs', 'scheduled_for')
+    with op.batch_alter_table('runs') as batch_op:
+        batch_op.drop_index('ix_runs_scheduled_for')
+        batch_op.drop_column('scheduled_for')
@@ -0,0 +1,40 @@
+"""Replace the notification_settings user_id index with a unique constraint.
+
+Revision ID: h8i9j0k1l234
+Revises: g7h8i9j0k123
+Create Date: 2026-10-17 10:00:00.000000
+
+g7h8i9j0k123 enforces one settings row per user with a separate unique index
+on user_id. Rebuild the table so the rule is a named UNIQUE constraint in the
+table definition instead, which saves maintaining the extra index.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.db.schema_cache import get_schema_cache
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'h8i9j0k1l234'
+down_revision: Union[str, None] = 'g7h8i9j0k123'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    schema = get_schema_cache(op.get_bind())
+    if schema.has_index('notification_settings', 'ix_notification_settings_user_id'):
+        with op.batch_alter_table('notification_settings', recreate='always') as batch_op:
+            batch_op.drop_index('ix_notification_settings_user_id')
+            batch_op.create_unique_constraint('uix_notification_settings_user', ['user_id'])
+        schema.remove_index('notification_settings', 'ix_notification_settings_user_id')
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('notification_settings', recreate='always') as batch_op:
+        batch_op.drop_constraint('uix_notification_settings_user', type_='unique')
+        batch_op.create_index('ix_notification_settings_user_id', ['user_id'], unique=True)
+    get_schema_cache(op.get_bind()).add_index(
+        'notification_settings', 'ix_notification_settings_user_id'
+    )
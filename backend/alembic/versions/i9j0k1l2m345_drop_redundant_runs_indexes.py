@@ -0,0 +1,41 @@
+"""Drop single-column runs indexes covered by composite indexes.
+
+Revision ID: i9j0k1l2m345
+Revises: h8i9j0k1l234
+Create Date: 2026-10-17 11:00:00.000000
+
+ix_runs_user_created, ix_runs_status_created and ix_runs_benchmark_created
+lead with user_id, status and benchmark, so the planner can use them for
+any lookup the single-column indexes served. Dropping the duplicates saves
+an index update on every write to runs.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'i9j0k1l2m345'
+down_revision: Union[str, None] = 'h8i9j0k1l234'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, columns) on the runs table
+INDEXES = (
+    ('ix_runs_user_id', ['user_id']),
+    ('ix_runs_status', ['status']),
+    ('ix_runs_benchmark', ['benchmark']),
+)
+
+
+def upgrade() -> None:
+    """Drop redundant runs indexes."""
+    for name, _ in INDEXES:
+        op.drop_index(name, table_name='runs', if_exists=True)
+
+
+def downgrade() -> None:
+    """Restore the single-column runs indexes."""
+    for name, columns in INDEXES:
+        op.create_index(name, 'runs', columns, unique=False, if_not_exists=True)
@@ -0,0 +1,44 @@
+"""Replace the scheduled_for index with a partial index on pending runs.
+
+Revision ID: j0k1l2m3n456
+Revises: i9j0k1l2m345
+Create Date: 2026-10-17 12:00:00.000000
+
+The scheduler only looks at queued runs that have a scheduled_for time, a
+small fraction of the runs table. Indexing just the scheduled rows keeps the
+index small, and leading with status lets the scheduler's
+"status = ? AND scheduled_for <= ?" poll use one index for both the filter
+and the ORDER BY. The queries already repeat the index's
+"scheduled_for IS NOT NULL" term, which SQLite requires before it will use a
+partial index.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'j0k1l2m3n456'
+down_revision: Union[str, None] = 'i9j0k1l2m345'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Swap the full scheduled_for index for a partial one."""
+    op.drop_index('ix_runs_scheduled_for', table_name='runs', if_exists=True)
+    op.create_index(
+        'ix_runs_scheduled_pending',
+        'runs',
+        ['status', 'scheduled_for'],
+        unique=False,
+        sqlite_where=sa.text('scheduled_for IS NOT NULL'),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Restore the full scheduled_for index."""
+    op.drop_index('ix_runs_scheduled_pending', table_name='runs', if_exists=True)
+    op.create_index('ix_runs_scheduled_for', 'runs', ['scheduled_for'], unique=False, if_not_exists=True)
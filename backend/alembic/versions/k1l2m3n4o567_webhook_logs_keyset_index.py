@@ -0,0 +1,41 @@
+"""Index webhook logs for keyset pagination by user.
+
+Revision ID: k1l2m3n4o567
+Revises: j0k1l2m3n456
+Create Date: 2026-10-17 13:00:00.000000
+
+The logs endpoint pages through a user's logs newest first, continuing
+after the (created_at, log_id) of the previous page's last entry. An index
+on (user_id, created_at, log_id) serves both the filter and the ORDER BY
+(SQLite walks it backwards for DESC), so each page is a range seek instead
+of a scan and sort. It leads with user_id, so it also replaces
+ix_webhook_logs_user_id.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'k1l2m3n4o567'
+down_revision: Union[str, None] = 'j0k1l2m3n456'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Swap the user_id index for a (user_id, created_at, log_id) index."""
+    op.create_index(
+        'ix_webhook_logs_user_created',
+        'webhook_logs',
+        ['user_id', 'created_at', 'log_id'],
+        unique=False,
+        if_not_exists=True,
+    )
+    op.drop_index('ix_webhook_logs_user_id', table_name='webhook_logs', if_exists=True)
+
+
+def downgrade() -> None:
+    """Restore the single-column user_id index."""
+    op.create_index('ix_webhook_logs_user_id', 'webhook_logs', ['user_id'], unique=False, if_not_exists=True)
+    op.drop_index('ix_webhook_logs_user_created', table_name='webhook_logs', if_exists=True)
@@ -0,0 +1,37 @@
+"""Index webhook logs for event type and status filters.
+
+Revision ID: l2m3n4o5p678
+Revises: k1l2m3n4o567
+Create Date: 2026-10-17 14:00:00.000000
+
+The logs endpoint can filter a user's logs by event_type and status. An
+index on (user_id, event_type, status, created_at, log_id) turns a filtered
+page into a range seek in keyset order, instead of walking every log of the
+user and discarding the rows that do not match.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'l2m3n4o5p678'
+down_revision: Union[str, None] = 'k1l2m3n4o567'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the filtered webhook logs index."""
+    op.create_index(
+        'ix_webhook_logs_user_event_status',
+        'webhook_logs',
+        ['user_id', 'event_type', 'status', 'created_at', 'log_id'],
+        unique=False,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Drop the filtered webhook logs index."""
+    op.drop_index('ix_webhook_logs_user_event_status', table_name='webhook_logs', if_exists=True)
@@ -0,0 +1,37 @@
+"""Index webhook logs for status-only filters.
+
+Revision ID: m3n4o5p6q789
+Revises: l2m3n4o5p678
+Create Date: 2026-10-17 18:00:00.000000
+
+ix_webhook_logs_user_event_status only serves a status filter when event_type
+is filtered too, since event_type comes before status in it. An index on
+(user_id, status, created_at, log_id) lets a status-only filter seek and
+read its page in keyset order as well.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'm3n4o5p6q789'
+down_revision: Union[str, None] = 'l2m3n4o5p678'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the status-filtered webhook logs index."""
+    op.create_index(
+        'ix_webhook_logs_user_status',
+        'webhook_logs',
+        ['user_id', 'status', 'created_at', 'log_id'],
+        unique=False,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Drop the status-filtered webhook logs index."""
+    op.drop_index('ix_webhook_logs_user_status', table_name='webhook_logs', if_exists=True)
@@ -5,11 +5,16 @@ API keys are encrypted at rest using AES-256 encryption.
 They are used to authenticate with LLM providers when running benchmarks.
 """
 
-from typing import List, Optional, Tuple
+from functools import partial
+from typing import AsyncIterator, List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, Query, Request
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from pydantic_core import to_json
 
 from app.core.auth import get_current_user
+from app.core.etag import etag_matches, make_etag
 from app.core.rate_limit import limiter, get_user_id_or_ip, RATE_LIMIT_AVAILABLE_MODELS
 from app.core.errors import ApiKeyNotFoundError
 from app.db.models import (
@@ -25,13 +30,41 @@ from app.services.api_keys import api_key_service
 from app.services.model_discovery import model_discovery_service, ModelInfo, ModelProvider
 from app.services.model_capabilities import (
     ModelCapabilities,
-    enrich_model_with_capabilities,
     check_model_benchmark_compatibility,
 )
 from app.services.benchmark_catalog import get_benchmark_requirements
 
 router = APIRouter()
 
+# The provider list is static, so serialize it once at import
+_PROVIDERS_JSON = TypeAdapter(List[ProviderInfo]).dump_json([
+    ProviderInfo(
+        provider=provider_id,
+        env_var=info["env_var"],
+        display_name=info["display_name"],
+        color=info["color"],
+    )
+    for provider_id, info in PREDEFINED_PROVIDERS.items()
+])
+_PROVIDERS_ETAG = make_etag(_PROVIDERS_JSON)
+_PROVIDERS_HEADERS = {
+    "ETag": _PROVIDERS_ETAG,
+    "Cache-Control": "public, max-age=3600",
+}
+
+_API_KEYS_ADAPTER = TypeAdapter(List[ApiKeyPublic])
+_MODEL_PROVIDER_ADAPTER = TypeAdapter(ModelProvider)
+
+
+async def _stream_providers(providers: List[ModelProvider]) -> AsyncIterator[bytes]:
+    """Yield a ``{"providers": [...]}`` document one provider at a time."""
+    yield b'{"providers":['
+    for index, provider in enumerate(providers):
+        if index:
+            yield b","
+        yield _MODEL_PROVIDER_ADAPTER.dump_json(provider)
+    yield b"]}"
+
 
 @router.get(
     "/api-keys",
@@ -68,7 +101,8 @@ async def list_api_keys(current_user: User = Depends(get_current_user)):
     
     **Requires authentication.**
     """
-    return await api_key_service.list_keys(current_user.user_id)
+    keys = await api_key_service.list_keys(current_user.user_id)
+    return Response(content=_API_KEYS_ADAPTER.dump_json(keys), media_type="application/json")
 
 
 @router.post(
@@ -176,7 +210,7 @@ async def delete_api_key(
         }
     }
 )
-async def list_providers():
+async def list_providers(request: Request):
     """
     List all supported API key providers.
     
@@ -186,17 +220,26 @@ async def list_providers():
     - **display_name**: Human-readable provider name
     - **color**: Brand color for UI display
     
-    This endpoint does not require authentication.
+    This endpoint does not require authentication. Responses carry an ETag,
+    so clients can revalidate with `If-None-Match` and get a 304.
     """
-    return [
-        {
-            "provider": provider_id,
-            "env_var": info["env_var"],
-            "display_name": info["display_name"],
-            "color": info["color"],
-        }
-        for provider_id, info in PREDEFINED_PROVIDERS.items()
-    ]
+    if etag_matches(request, _PROVIDERS_ETAG):
+        return Response(status_code=304, headers=_PROVIDERS_HEADERS)
+    return Response(
+        content=_PROVIDERS_JSON,
+        media_type="application/json",
+        headers=_PROVIDERS_HEADERS,
+    )
+
+
+def has_requirements(requirements: BenchmarkRequirements) -> bool:
+    """Check if a benchmark requires any model capability at all."""
+    return bool(
+        requirements.vision
+        or requirements.code_execution
+        or requirements.function_calling
+        or requirements.min_context_length
+    )
 
 
 def check_compatibility(
@@ -213,6 +256,8 @@ def check_compatibility(
     Returns:
         Tuple of (is_compatible, reason_if_not)
     """
+    if not has_requirements(requirements):
+        return True, None
     return check_model_benchmark_compatibility(
         model_capabilities=model.capabilities,
         model_context_length=model.context_length,
@@ -293,18 +338,12 @@ async def get_available_models(
     """
     providers = await model_discovery_service.get_available_models(
         current_user.user_id,
-        force_refresh=force_refresh
+        force_refresh=force_refresh,
+        include_capabilities=include_capabilities,
     )
     
-    if include_capabilities:
-        # Enrich each model with capability information
-        for provider in providers:
-            provider.models = [
-                enrich_model_with_capabilities(model)
-                for model in provider.models
-            ]
-    
-    return {"providers": [p.dict() for p in providers]}
+    # Stream provider by provider so large model lists start sending at once
+    return StreamingResponse(_stream_providers(providers), media_type="application/json")
 
 
 @router.get(
@@ -364,9 +403,10 @@ async def get_compatible_models(
     
     **Requires authentication.**
     """
-    # Get all available models
+    # Get all available models, already enriched with capabilities
     all_providers = await model_discovery_service.get_available_models(
-        current_user.user_id
+        current_user.user_id,
+        include_capabilities=True,
     )
     
     # Get benchmark requirements
@@ -375,33 +415,42 @@ async def get_compatible_models(
     compatible_providers: List[ModelProvider] = []
     incompatible_models: List[dict] = []
     
-    for provider in all_providers:
-        compatible_models: List[ModelInfo] = []
-        
-        for model in provider.models:
-            # Enrich with capabilities
-            enriched = enrich_model_with_capabilities(model)
-            
-            # Check compatibility
-            is_compatible, reason = check_compatibility(enriched, requirements)
+    if not has_requirements(requirements):
+        # Nothing to check: every model qualifies
+        compatible_providers = [p for p in all_providers if p.models]
+    else:
+        # Bind the requirements once instead of re-reading them per model
+        check = partial(
+            check_model_benchmark_compatibility,
+            requires_vision=requirements.vision,
+            requires_code_execution=requirements.code_execution,
+            requires_function_calling=requirements.function_calling,
+            min_context_length=requirements.min_context_length,
+        )
+        for provider in all_providers:
+            results = [
+                (model, check(model.capabilities, model.context_length))
+                for model in provider.models
+            ]
+            compatible_models = [model for model, (is_compatible, _) in results if is_compatible]
+            incompatible_models.extend(
+                {"model_id": model.id, "reason": reason}
+                for model, (is_compatible, reason) in results
+                if not is_compatible
+            )
             
-            if is_compatible:
-                compatible_models.append(enriched)
-            else:
-                incompatible_models.append({
-                    "model_id": model.id,
-                    "reason": reason
-                })
-        
-        if compatible_models:
-            compatible_providers.append(ModelProvider(
-                name=provider.name,
-                provider_key=provider.provider_key,
-                models=compatible_models
-            ))
+            if compatible_models:
+                compatible_providers.append(ModelProvider(
+                    name=provider.name,
+                    provider_key=provider.provider_key,
+                    models=compatible_models
+                ))
     
-    return {
-        "providers": [p.dict() for p in compatible_providers],
-        "incompatible": incompatible_models,
-        "requirements": requirements.dict()
-    }
+    return Response(
+        content=to_json({
+            "providers": compatible_providers,
+            "incompatible": incompatible_models,
+            "requirements": requirements,
+        }),
+        media_type="application/json",
+    )
@@ -4,7 +4,8 @@ Authentication routes for user registration, login, and profile management.
 All authentication uses JWT tokens with Bearer authentication scheme.
 """
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Request, Response
+from pydantic_core import to_json
 
 from app.core.auth import get_current_user
 from app.core.errors import InvalidCredentialsError, EmailExistsError, ErrorResponse
@@ -165,9 +166,13 @@ async def get_me(current_user: User = Depends(get_current_user)):
     
     **Requires authentication.**
     """
-    return UserPublic(
-        user_id=current_user.user_id,
-        email=current_user.email,
-        created_at=current_user.created_at,
-        is_active=current_user.is_active,
+    # Serialize the public fields directly; this endpoint is polled often
+    return Response(
+        content=to_json({
+            "user_id": current_user.user_id,
+            "email": current_user.email,
+            "created_at": current_user.created_at,
+            "is_active": current_user.is_active,
+        }),
+        media_type="application/json",
     )
@@ -7,16 +7,56 @@ Benchmarks can come from multiple sources:
 - Custom/plugin benchmarks
 """
 
-from typing import List
+import gzip
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Request, Response
+from pydantic import TypeAdapter
 
+from app.core.etag import etag_matches, make_etag
 from app.db.models import Benchmark
 from app.services.benchmark_catalog import get_benchmark, get_benchmarks
 
 router = APIRouter()
 
+_BENCHMARKS_ADAPTER = TypeAdapter(List[Benchmark])
+
+
+@dataclass
+class BenchmarkListPayload:
+    """Serialized benchmark list, plain and gzipped, with an ETag for each."""
+    benchmarks: List[Benchmark]
+    body: bytes
+    etag: str
+    gzip_body: bytes
+    gzip_etag: str
+
+
+# Payload built from the catalog list it came from. The catalog returns the
+# same list object until it refreshes, so identity tells us when to rebuild.
+_benchmarks_payload: Optional[BenchmarkListPayload] = None
+
+# Serialized benchmark details by name, paired with the catalog's Benchmark
+# object so a refreshed catalog entry is re-serialized
+_benchmark_detail_json: Dict[str, Tuple[Benchmark, bytes]] = {}
+
+
+def _accepts_gzip(request: Request) -> bool:
+    """Check whether the client's Accept-Encoding allows gzip."""
+    for coding in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() not in ("gzip", "*"):
+            continue
+        quality = params.strip().replace(" ", "")
+        if not quality.startswith("q="):
+            return True
+        try:
+            return float(quality[2:]) > 0
+        except ValueError:
+            return False
+    return False
+
 
 @router.get(
     "/benchmarks",
@@ -50,7 +90,7 @@ router = APIRouter()
         }
     }
 )
-async def list_benchmarks():
+async def list_benchmarks(request: Request):
     """
     List all available benchmarks with capability requirements.
     
@@ -72,17 +112,39 @@ async def list_benchmarks():
     
     This endpoint does not require authentication.
     
-    Response is cached for 5 minutes as benchmark list rarely changes.
+    Response is cached for 5 minutes as benchmark list rarely changes, and
+    carries an ETag so clients can revalidate with `If-None-Match`. The
+    payload is gzipped once per catalog refresh for clients that accept it.
     """
+    global _benchmarks_payload
     benchmarks = await get_benchmarks()
+    if _benchmarks_payload is None or _benchmarks_payload.benchmarks is not benchmarks:
+        body = _BENCHMARKS_ADAPTER.dump_json(benchmarks)
+        gzip_body = gzip.compress(body, compresslevel=6)
+        _benchmarks_payload = BenchmarkListPayload(
+            benchmarks=benchmarks,
+            body=body,
+            etag=make_etag(body),
+            gzip_body=gzip_body,
+            gzip_etag=make_etag(gzip_body),
+        )
+    payload = _benchmarks_payload
+    
     # Return with cache headers - benchmark list is static/rarely changes
-    return JSONResponse(
-        content=[b.model_dump() for b in benchmarks],
-        headers={
-            "Cache-Control": "public, max-age=300",  # Cache for 5 minutes
-            "Vary": "Accept-Encoding",
-        }
-    )
+    headers = {
+        "Cache-Control": "public, max-age=300",  # Cache for 5 minutes
+        "Vary": "Accept-Encoding",
+    }
+    if _accepts_gzip(request):
+        body, headers["ETag"] = payload.gzip_body, payload.gzip_etag
+        headers["Content-Encoding"] = "gzip"
+    else:
+        body, headers["ETag"] = payload.body, payload.etag
+    
+    if etag_matches(request, headers["ETag"]):
+        headers.pop("Content-Encoding", None)
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get(
@@ -126,4 +188,8 @@ async def get_benchmark_detail(name: str):
     benchmark = await get_benchmark(name)
     if benchmark is None:
         raise HTTPException(status_code=404, detail="Benchmark not found")
-    return benchmark
+    
+    cached = _benchmark_detail_json.get(name)
+    if cached is None or cached[0] is not benchmark:
+        cached = _benchmark_detail_json[name] = (benchmark, benchmark.model_dump_json().encode())
+    return Response(content=cached[1], media_type="application/json")
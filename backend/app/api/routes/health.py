@@ -7,18 +7,32 @@ Provides:
 - /version - Detailed version information
 """
 
+import asyncio
 import time
 import subprocess
 import shutil
-from typing import Literal
+from functools import lru_cache
+from typing import Literal, Optional, Tuple
 
 from fastapi import APIRouter, Response, status
 from pydantic import BaseModel, Field, ConfigDict
 
 from app.db.session import get_db
 
-# Track application start time for uptime calculation
-_start_time = time.time()
+# Track application start time for uptime calculation (monotonic, so clock
+# adjustments never make uptime jump or go negative)
+_start_monotonic = time.monotonic()
+
+# Detected OpenBench version and the monotonic time it was detected at.
+# Detection may shell out to the CLI, so it is re-run at most every few minutes.
+OPENBENCH_VERSION_TTL_SECONDS = 300
+_openbench_version_cache: Optional[Tuple[Optional[str], float]] = None
+
+# Last database check result and when it ran, plus the check currently running.
+# Probes hitting /health and /ready share these instead of each querying the DB.
+DB_CHECK_TTL_SECONDS = 1.0
+_db_check_cache: Optional[Tuple[bool, float]] = None
+_db_check_inflight: Optional["asyncio.Task[bool]"] = None
 
 router = APIRouter()
 
@@ -95,8 +109,9 @@ class VersionResponse(BaseModel):
 # Helper Functions
 # =============================================================================
 
+@lru_cache(maxsize=1)
 def get_app_version() -> str:
-    """Get the application version from package metadata."""
+    """Get the application version from package metadata (fixed for the process)."""
     try:
         from importlib.metadata import version
         return version("openbench-web-backend")
@@ -105,8 +120,29 @@ def get_app_version() -> str:
 
 
 def get_openbench_version() -> str | None:
-    """Get the installed OpenBench version."""
+    """Get the installed OpenBench version (cached for a few minutes)."""
+    global _openbench_version_cache
+    now = time.monotonic()
+    if _openbench_version_cache is not None:
+        version, detected_at = _openbench_version_cache
+        if now - detected_at < OPENBENCH_VERSION_TTL_SECONDS:
+            return version
+    
+    version = _detect_openbench_version()
+    _openbench_version_cache = (version, now)
+    return version
+
+
+def _detect_openbench_version() -> str | None:
+    """Detect the installed OpenBench version from package metadata, the package, or the CLI."""
     try:
+        # Read the installed distribution's metadata (no import, no subprocess)
+        try:
+            from importlib.metadata import PackageNotFoundError, version
+            return version("openbench")
+        except PackageNotFoundError:
+            pass
+        
         # Try importing openbench to get version
         try:
             import openbench
@@ -147,9 +183,56 @@ async def check_database() -> bool:
         return False
 
 
+async def cached_check_database() -> bool:
+    """
+    Check if database is accessible, reusing a recent or in-flight check.
+    
+    At most one check runs at a time, and its result is reused for
+    DB_CHECK_TTL_SECONDS.
+    """
+    global _db_check_inflight
+    if _db_check_cache is not None:
+        ok, checked_at = _db_check_cache
+        if time.monotonic() - checked_at < DB_CHECK_TTL_SECONDS:
+            return ok
+    
+    if _db_check_inflight is None:
+        _db_check_inflight = asyncio.ensure_future(_run_database_check())
+    # Shield so one caller disconnecting does not cancel the shared check
+    return await asyncio.shield(_db_check_inflight)
+
+
+async def _run_database_check() -> bool:
+    """Run a database check and record its result."""
+    global _db_check_cache, _db_check_inflight
+    try:
+        ok = await check_database()
+        _db_check_cache = (ok, time.monotonic())
+        return ok
+    finally:
+        _db_check_inflight = None
+
+
 def get_uptime() -> float:
     """Get seconds since application start."""
-    return time.time() - _start_time
+    return time.monotonic() - _start_monotonic
+
+
+@lru_cache(maxsize=2)
+def _health_body_prefix(db_ok: bool) -> bytes:
+    """
+    Serialized health response up to the uptime value.
+    
+    Everything but the uptime is fixed for a given database outcome, so
+    it is validated and serialized once per outcome.
+    """
+    body = HealthResponse(
+        status="healthy" if db_ok else "unhealthy",
+        database="connected" if db_ok else "error",
+        version=get_app_version(),
+        uptime=0.0,
+    ).model_dump_json(exclude={"uptime"})
+    return body[:-1].encode() + b',"uptime":'
 
 
 # =============================================================================
@@ -199,7 +282,7 @@ Use this endpoint for container health checks and monitoring systems.
         }
     }
 )
-async def health_check() -> HealthResponse:
+async def health_check() -> Response:
     """
     Health check endpoint.
     
@@ -207,13 +290,12 @@ async def health_check() -> HealthResponse:
     application version, and uptime. Always returns 200 to allow monitoring
     systems to parse the response body for health determination.
     """
-    db_ok = await check_database()
+    db_ok = await cached_check_database()
+    uptime = repr(round(get_uptime(), 2)).encode()
     
-    return HealthResponse(
-        status="healthy" if db_ok else "unhealthy",
-        database="connected" if db_ok else "error",
-        version=get_app_version(),
-        uptime=round(get_uptime(), 2)
+    return Response(
+        content=_health_body_prefix(db_ok) + uptime + b"}",
+        media_type="application/json",
     )
 
 
@@ -265,7 +347,7 @@ async def readiness_check(response: Response) -> ReadyResponse:
     This endpoint should be used for Kubernetes readiness probes to control
     traffic routing to pods.
     """
-    db_ok = await check_database()
+    db_ok = await cached_check_database()
     
     if not db_ok:
         response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
@@ -305,7 +387,10 @@ async def get_version() -> VersionResponse:
     - **openbench**: Version of the installed OpenBench CLI (if available)
     - **openbench_available**: Whether the OpenBench CLI is installed and accessible
     """
-    openbench_version = get_openbench_version()
+    # Detection may import openbench or run `bench --version`, so it runs in
+    # a worker thread rather than on the event loop
+    loop = asyncio.get_event_loop()
+    openbench_version = await loop.run_in_executor(None, get_openbench_version)
     
     return VersionResponse(
         web_ui=get_app_version(),
@@ -4,17 +4,69 @@ Notification settings and webhook management routes.
 Handles webhook configuration and testing.
 """
 
-from typing import Optional
+from typing import Annotated, Callable, Literal, Optional, Union
 
-from fastapi import APIRouter, Depends
-from pydantic import BaseModel, Field, field_validator
-import re
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.routing import APIRoute
+from pydantic import AnyHttpUrl, BaseModel, Field, UrlConstraints
+from pydantic_core import to_json
 
 from app.core.auth import get_current_user
+from app.core.errors import InvalidCursorError
 from app.db.models import User
 from app.services.notifications import notification_service
 
-router = APIRouter()
+# Largest request body accepted by these routes; their payloads are a URL
+# and a few flags
+MAX_BODY_BYTES = 4096
+
+
+class LimitedBodyRoute(APIRoute):
+    """
+    Route that rejects oversized request bodies up front.
+    
+    A declared Content-Length is checked before anything is read. Otherwise
+    (e.g. chunked uploads) the body is read with a running count and refused
+    as soon as it passes the limit. Either way this happens before FastAPI
+    parses the body (dependencies only run after that).
+    """
+    
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        
+        async def limited_handler(request: Request) -> Response:
+            content_length = request.headers.get("content-length")
+            if content_length and content_length.isdigit():
+                if int(content_length) > MAX_BODY_BYTES:
+                    _raise_body_too_large()
+            else:
+                body = b""
+                async for chunk in request.stream():
+                    body += chunk
+                    if len(body) > MAX_BODY_BYTES:
+                        _raise_body_too_large()
+                # Request.body() returns this instead of reading the stream again
+                request._body = body
+            return await handler(request)
+        
+        return limited_handler
+
+
+def _raise_body_too_large() -> None:
+    """Reject a request whose body is over MAX_BODY_BYTES."""
+    # Literal code: Starlette renamed the 413 constant between releases
+    raise HTTPException(
+        status_code=413,
+        detail=f"Request body must be at most {MAX_BODY_BYTES} bytes",
+    )
+
+
+router = APIRouter(route_class=LimitedBodyRoute)
+
+# HTTP(S) URL parsed natively by pydantic-core; overlong input is rejected
+# on its length alone
+WEBHOOK_URL_MAX_LENGTH = 2048
+WebhookUrl = Annotated[AnyHttpUrl, UrlConstraints(max_length=WEBHOOK_URL_MAX_LENGTH)]
 
 
 class NotificationSettingsResponse(BaseModel):
@@ -27,48 +79,18 @@ class NotificationSettingsResponse(BaseModel):
 
 class NotificationSettingsUpdate(BaseModel):
     """Request to update notification settings."""
-    webhook_url: Optional[str] = Field(None, description="Webhook URL (must be https)")
+    # An empty string is accepted and treated like an omitted URL
+    webhook_url: Optional[Union[WebhookUrl, Literal[""]]] = Field(
+        None, description="Webhook URL (must be http or https)"
+    )
     webhook_enabled: Optional[bool] = Field(None, description="Enable/disable webhooks")
     notify_on_complete: Optional[bool] = Field(None, description="Notify on completion")
     notify_on_failure: Optional[bool] = Field(None, description="Notify on failure")
 
-    @field_validator('webhook_url')
-    @classmethod
-    def validate_webhook_url(cls, v: Optional[str]) -> Optional[str]:
-        if v is None or v == "":
-            return None
-        # Basic URL validation - must be https or http for local testing
-        url_pattern = re.compile(
-            r'^https?://'  # http:// or https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain
-            r'localhost|'  # localhost
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or IP
-            r'(?::\d+)?'  # optional port
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE
-        )
-        if not url_pattern.match(v):
-            raise ValueError('Invalid webhook URL. Must be a valid HTTP(S) URL.')
-        return v
-
 
 class WebhookTestRequest(BaseModel):
     """Request to test a webhook URL."""
-    webhook_url: str = Field(..., description="Webhook URL to test")
-
-    @field_validator('webhook_url')
-    @classmethod
-    def validate_webhook_url(cls, v: str) -> str:
-        url_pattern = re.compile(
-            r'^https?://'
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'
-            r'localhost|'
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
-            r'(?::\d+)?'
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE
-        )
-        if not url_pattern.match(v):
-            raise ValueError('Invalid webhook URL. Must be a valid HTTP(S) URL.')
-        return v
+    webhook_url: WebhookUrl = Field(..., description="Webhook URL to test")
 
 
 class WebhookTestResponse(BaseModel):
@@ -121,7 +143,8 @@ async def get_notification_settings(
     **Requires authentication.**
     """
     settings = await notification_service.get_settings(current_user.user_id)
-    return NotificationSettingsResponse(**settings)
+    # The service already returns exactly the response fields
+    return Response(content=to_json(settings), media_type="application/json")
 
 
 @router.patch(
@@ -134,6 +157,7 @@ async def get_notification_settings(
             "description": "Updated notification settings",
         },
         401: {"description": "Not authenticated"},
+        413: {"description": "Request body too large"},
         422: {"description": "Invalid webhook URL"},
     }
 )
@@ -150,12 +174,12 @@ async def update_notification_settings(
     """
     settings = await notification_service.update_settings(
         user_id=current_user.user_id,
-        webhook_url=update.webhook_url,
+        webhook_url=str(update.webhook_url) if update.webhook_url else None,
         webhook_enabled=update.webhook_enabled,
         notify_on_complete=update.notify_on_complete,
         notify_on_failure=update.notify_on_failure,
     )
-    return NotificationSettingsResponse(**settings)
+    return Response(content=to_json(settings), media_type="application/json")
 
 
 @router.post(
@@ -188,6 +212,7 @@ async def update_notification_settings(
             }
         },
         401: {"description": "Not authenticated"},
+        413: {"description": "Request body too large"},
         422: {"description": "Invalid webhook URL"},
     }
 )
@@ -199,19 +224,20 @@ async def test_webhook(
     Send a test notification to a webhook URL.
     
     This sends a test payload with `event: "test"` to verify the webhook is working.
-    The test uses the same retry logic as real notifications (3 attempts with backoff).
+    The test uses the same retry logic as real notifications (3 attempts with backoff),
+    except that a host whose recent deliveries kept failing is tried only once.
     
     **Requires authentication.**
     """
     success, status_code, error = await notification_service.test_webhook(
         user_id=current_user.user_id,
-        webhook_url=request.webhook_url,
+        webhook_url=str(request.webhook_url),
     )
     
     if success:
         message = f"Webhook delivered successfully (status: {status_code})"
     else:
-        message = f"Webhook delivery failed after 3 attempts"
+        message = "Webhook delivery failed"
         if error:
             message = f"{message}: {error}"
     
@@ -231,24 +257,44 @@ async def test_webhook(
         200: {
             "description": "List of webhook delivery logs",
         },
+        400: {"description": "Cursor is not one of the user's logs"},
         401: {"description": "Not authenticated"},
     }
 )
 async def get_webhook_logs(
-    limit: int = 50,
-    offset: int = 0,
+    limit: int = Query(50, ge=1, le=100, description="Maximum number of logs to return"),
+    cursor: Optional[str] = Query(
+        None, description="log_id of the last entry of the previous page"
+    ),
+    event_type: Optional[str] = Query(
+        None, description="Only logs for this event (run_completed, run_failed, test)"
+    ),
+    status: Optional[str] = Query(None, description="Only logs with this status (success, failed)"),
+    offset: int = Query(
+        0, ge=0, deprecated=True, description="Number of logs to skip; use cursor instead"
+    ),
     current_user: User = Depends(get_current_user),
 ):
     """
-    Get recent webhook delivery logs.
+    Get recent webhook delivery logs, newest first.
     
-    Shows both successful and failed webhook deliveries.
+    Shows both successful and failed webhook deliveries, optionally filtered
+    by `event_type` and `status`. To fetch the next page, pass the `log_id`
+    of the last entry as `cursor`. `offset` still works but is deprecated:
+    it rescans every skipped log and can skip or repeat entries as new ones
+    are logged.
     
     **Requires authentication.**
     """
     logs = await notification_service.get_webhook_logs(
         user_id=current_user.user_id,
-        limit=min(limit, 100),
+        limit=limit,
+        cursor=cursor,
+        event_type=event_type,
+        status=status,
         offset=offset,
     )
-    return [WebhookLogEntry(**log) for log in logs]
+    if logs is None:
+        raise InvalidCursorError()
+    # The service already returns exactly the WebhookLogEntry fields
+    return Response(content=to_json(logs), media_type="application/json")
@@ -6,13 +6,19 @@ Includes Server-Sent Events (SSE) for real-time progress updates.
 """
 
 import asyncio
+import functools
+import itertools
 import os
+import stat
+import threading
 from datetime import datetime
-from typing import AsyncGenerator, List, Optional
+from pathlib import Path
+from typing import AsyncGenerator, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, Response
 from fastapi.responses import FileResponse, StreamingResponse
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
+from pydantic_core import to_json
 
 from app.core.auth import get_current_user, get_optional_user
 from app.core.config import RUNS_DIR
@@ -44,12 +50,30 @@ from app.db.models import (
 )
 from app.runner.artifacts import list_artifacts, read_command, read_log_tail, read_summary
 from app.runner.executor import executor
-from app.runner.progress_parser import parse_progress
+from app.runner.progress_parser import parse_progress_from_lines
 from app.services.api_keys import api_key_service
-from app.services.run_store import run_store
+from app.services.run_store import DeleteResult, run_store
 
 router = APIRouter()
 
+# List endpoints serialize directly instead of re-validating through response_model
+_RUN_SUMMARIES_ADAPTER = TypeAdapter(List[RunSummary])
+
+# Parsed .eval data by (path, mtime_ns, size), least recently used first.
+# Parsing a log is slow, and a rewritten file gets a new key.
+EVAL_DATA_CACHE_SIZE = 32
+_eval_data_cache: Dict[Tuple[str, int, int], dict] = {}
+
+# Media types for artifact downloads by file extension (others are binary)
+# Resolved once; artifact paths are checked against it after resolving them
+_RUNS_DIR_REAL = RUNS_DIR.resolve()
+
+_ARTIFACT_MEDIA_TYPES = {
+    ".json": "application/json",
+    ".txt": "text/plain",
+    ".log": "text/plain",
+}
+
 
 @router.post(
     "/runs",
@@ -209,13 +233,14 @@ async def list_runs(
         sort_order=sort_order,
     )
     
-    return RunListResponse(
+    run_list = RunListResponse(
         runs=runs,
         total=total,
         page=page,
         per_page=per_page,
         has_more=(page * per_page) < total,
     )
+    return Response(content=run_list.model_dump_json(), media_type="application/json")
 
 
 @router.get(
@@ -302,19 +327,23 @@ async def get_run(
     if run is None:
         raise RunNotFoundError(run_id)
     
+    # Read the artifact files (command.txt for reproducibility, log tails,
+    # summary.json if available) concurrently in worker threads
+    loop = asyncio.get_event_loop()
+    artifacts, cmd, stdout_tail, stderr_tail, summary = await asyncio.gather(
+        loop.run_in_executor(None, list_artifacts, run_id),
+        loop.run_in_executor(None, read_command, run_id),
+        loop.run_in_executor(None, read_log_tail, run_id, "stdout.log", log_lines),
+        loop.run_in_executor(None, read_log_tail, run_id, "stderr.log", log_lines),
+        loop.run_in_executor(None, read_summary, run_id),
+    )
+    
     # Build response with additional info
     response = run.model_dump()
-    response["artifacts"] = list_artifacts(run_id)
-    
-    # Read command.txt for reproducibility
-    cmd = read_command(run_id)
+    response["artifacts"] = artifacts
     response["command"] = cmd
-    
-    response["stdout_tail"] = read_log_tail(run_id, "stdout.log", log_lines)
-    response["stderr_tail"] = read_log_tail(run_id, "stderr.log", log_lines)
-    
-    # Read summary.json if available
-    summary = read_summary(run_id)
+    response["stdout_tail"] = stdout_tail
+    response["stderr_tail"] = stderr_tail
     response["summary"] = summary
     
     return response
@@ -413,20 +442,12 @@ async def delete_run(
     
     **Requires authentication.**
     """
-    run = await run_store.get_run(run_id, user_id=current_user.user_id)
-    if run is None:
+    result = await run_store.try_delete(run_id, user_id=current_user.user_id)
+    if result == DeleteResult.NOT_FOUND:
         raise RunNotFoundError(run_id)
-    
-    if run.status == RunStatus.RUNNING:
+    if result == DeleteResult.RUNNING:
         raise RunStillRunningError(action="delete")
     
-    success = await run_store.delete_run(run_id, user_id=current_user.user_id)
-    if not success:
-        raise ServerError(
-            message="Failed to delete run",
-            detail="An error occurred while deleting the run. Please try again."
-        )
-    
     return {"status": "deleted"}
 
 
@@ -488,20 +509,22 @@ async def bulk_delete_runs(
         "not_found": []
     }
     
-    for run_id in run_ids:
-        run = await run_store.get_run(run_id, user_id=current_user.user_id)
-        
-        if run is None:
+    # Delete first; only the runs left over are looked up to see why
+    unique_ids = list(dict.fromkeys(run_ids))
+    deleted = await run_store.bulk_delete(unique_ids, user_id=current_user.user_id)
+    remaining = [run_id for run_id in unique_ids if run_id not in deleted]
+    statuses = (
+        await run_store.get_run_statuses(remaining, user_id=current_user.user_id)
+        if remaining else {}
+    )
+    
+    for run_id in unique_ids:
+        if run_id in deleted:
+            results["deleted"].append(run_id)
+        elif run_id not in statuses:
             results["not_found"].append(run_id)
-            continue
-        
-        if run.status == RunStatus.RUNNING:
+        elif statuses[run_id] == RunStatus.RUNNING:
             results["running"].append(run_id)
-            continue
-        
-        success = await run_store.delete_run(run_id, user_id=current_user.user_id)
-        if success:
-            results["deleted"].append(run_id)
         else:
             results["failed"].append(run_id)
     
@@ -872,7 +895,8 @@ async def list_scheduled_runs(
     Authentication is optional for this endpoint.
     """
     user_id = current_user.user_id if current_user else None
-    return await run_store.list_scheduled_runs(user_id=user_id)
+    runs = await run_store.list_scheduled_runs(user_id=user_id)
+    return Response(content=_RUN_SUMMARIES_ADAPTER.dump_json(runs), media_type="application/json")
 
 
 @router.patch(
@@ -1033,30 +1057,56 @@ async def cancel_scheduled_run(
     return {"status": "canceled"}
 
 
-async def tail_file(path: str, position: int = 0) -> tuple[list[str], int]:
+# Most log output read from one file per SSE poll, so a burst of output is
+# streamed over several polls instead of being held in memory at once
+MAX_TAIL_BYTES = 1024 * 1024
+
+
+def _read_from(path: str, position: int) -> tuple[list[str], int]:
     """
-    Read new lines from a file starting at position.
-    Returns the new lines and the new position.
+    Read the lines after byte offset position from a file (blocking).
+    
+    A stat comes first, so a file that has not grown since the last read is
+    never opened. At most MAX_TAIL_BYTES are read, cut back to the last
+    complete line when the limit is hit.
     """
     lines = []
     try:
-        if os.path.exists(path):
-            with open(path, "r") as f:
-                f.seek(position)
-                content = f.read()
-                new_position = f.tell()
-                if content:
-                    lines = content.splitlines()
-                return lines, new_position
+        if os.path.getsize(path) <= position:
+            return lines, position
+        with open(path, "rb") as f:
+            f.seek(position)
+            content = f.read(MAX_TAIL_BYTES)
+        if len(content) == MAX_TAIL_BYTES:
+            end = content.rfind(b"\n")
+            if end >= 0:
+                content = content[:end + 1]
+            else:
+                # A single line longer than the limit: emit it in pieces
+                return content.decode("utf-8", errors="replace").splitlines(), position + len(content)
+        # Raises (and the read is retried next time) if the writer is
+        # partway through a multi-byte character
+        lines = content.decode("utf-8").splitlines()
+        return lines, position + len(content)
     except Exception:
         pass
     return lines, position
 
 
-def format_sse_event(event_type: str, data: dict) -> str:
-    """Format a Server-Sent Event."""
-    import json
-    return f"event: {event_type}\ndata: {json.dumps(data)}\n\n"
+async def tail_file(path: str, position: int = 0) -> tuple[list[str], int]:
+    """
+    Read new lines from a file starting at position.
+    Returns the new lines and the new position.
+    
+    The read runs in a worker thread so log tailing never blocks the event loop.
+    """
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(None, _read_from, path, position)
+
+
+def format_sse_event(event_type: str, data: dict) -> bytes:
+    """Format a Server-Sent Event, already encoded for the response stream."""
+    return b"event: " + event_type.encode() + b"\ndata: " + to_json(data) + b"\n\n"
 
 
 @router.get(
@@ -1108,7 +1158,7 @@ async def stream_run_events(run_id: str, request: Request):
     if run is None:
         raise RunNotFoundError(run_id)
     
-    async def event_generator() -> AsyncGenerator[str, None]:
+    async def event_generator() -> AsyncGenerator[bytes, None]:
         stdout_pos = 0
         stderr_pos = 0
         last_status = None
@@ -1119,13 +1169,39 @@ async def stream_run_events(run_id: str, request: Request):
         stdout_path = str(artifact_dir / "stdout.log")
         stderr_path = str(artifact_dir / "stderr.log")
         
+        def log_events(stdout_lines: list[str], stderr_lines: list[str]) -> list[bytes]:
+            """Build the log_line and progress events for newly read output."""
+            nonlocal last_progress
+            events = [
+                format_sse_event("log_line", {"stream": "stdout", "line": line})
+                for line in stdout_lines
+            ]
+            
+            # Only the latest progress matters, so parse from the end
+            progress = parse_progress_from_lines(stdout_lines)
+            if progress and progress != last_progress:
+                last_progress = progress
+                events.append(format_sse_event("progress", progress.to_dict()))
+            
+            events.extend(
+                format_sse_event("log_line", {"stream": "stderr", "line": line})
+                for line in stderr_lines
+            )
+            return events
+        
         while True:
             # Check if client disconnected
             if await request.is_disconnected():
                 break
             
-            # Get current run status
-            current_run = await run_store.get_run(run_id)
+            # Get current run status and new log output concurrently
+            current_run, (stdout_lines, stdout_pos), (stderr_lines, stderr_pos) = (
+                await asyncio.gather(
+                    run_store.get_run(run_id),
+                    tail_file(stdout_path, stdout_pos),
+                    tail_file(stderr_path, stderr_pos),
+                )
+            )
             if current_run is None:
                 break
             
@@ -1137,27 +1213,24 @@ async def stream_run_events(run_id: str, request: Request):
                     "timestamp": datetime.utcnow().isoformat(),
                 })
             
-            # Tail stdout
-            stdout_lines, stdout_pos = await tail_file(stdout_path, stdout_pos)
-            for line in stdout_lines:
-                yield format_sse_event("log_line", {
-                    "stream": "stdout",
-                    "line": line,
-                })
-                
-                # Try to parse progress
-                progress = parse_progress(line)
-                if progress and progress != last_progress:
-                    last_progress = progress
-                    yield format_sse_event("progress", progress.to_dict())
+            for event in log_events(stdout_lines, stderr_lines):
+                yield event
             
-            # Tail stderr
-            stderr_lines, stderr_pos = await tail_file(stderr_path, stderr_pos)
-            for line in stderr_lines:
-                yield format_sse_event("log_line", {
-                    "stream": "stderr",
-                    "line": line,
-                })
+            if current_run.status in (RunStatus.COMPLETED, RunStatus.FAILED, RunStatus.CANCELED):
+                # Each read is capped at MAX_TAIL_BYTES, and the logs may have
+                # been read just before the run finished: send everything left
+                # before the final event
+                while True:
+                    (stdout_lines, stdout_pos), (stderr_lines, stderr_pos) = (
+                        await asyncio.gather(
+                            tail_file(stdout_path, stdout_pos),
+                            tail_file(stderr_path, stderr_pos),
+                        )
+                    )
+                    if not stdout_lines and not stderr_lines:
+                        break
+                    for event in log_events(stdout_lines, stderr_lines):
+                        yield event
             
             # Check for terminal states
             if current_run.status == RunStatus.COMPLETED:
@@ -1249,14 +1322,13 @@ async def download_artifact(
         raise RunNotFoundError(run_id)
     
     # Build the full path and validate it's within the run directory
-    artifact_dir = RUNS_DIR / run_id
+    artifact_dir = _RUNS_DIR_REAL / run_id
     file_path = artifact_dir / artifact_path
     
     # Security check: ensure the path doesn't escape the run directory
     try:
         file_path = file_path.resolve()
-        artifact_dir = artifact_dir.resolve()
-        if not str(file_path).startswith(str(artifact_dir)):
+        if not file_path.is_relative_to(artifact_dir):
             raise ForbiddenError(
                 message="Access to this file is not allowed",
                 detail="The requested path is outside the run directory."
@@ -1269,28 +1341,281 @@ async def download_artifact(
             detail="The requested path could not be resolved."
         )
     
-    if not file_path.exists() or not file_path.is_file():
+    # One stat serves the existence check and the response headers
+    try:
+        file_stat = file_path.stat()
+    except OSError:
+        file_stat = None
+    if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
         raise NotFoundError(
             resource="Artifact",
             detail=f"File '{artifact_path}' not found in this run's artifacts."
         )
     
-    # Determine media type based on file extension
-    media_type = "application/octet-stream"
-    if artifact_path.endswith('.json'):
-        media_type = "application/json"
-    elif artifact_path.endswith('.txt'):
-        media_type = "text/plain"
-    elif artifact_path.endswith('.log'):
-        media_type = "text/plain"
-    
     return FileResponse(
         path=str(file_path),
-        media_type=media_type,
+        media_type=_ARTIFACT_MEDIA_TYPES.get(
+            Path(artifact_path).suffix.lower(), "application/octet-stream"
+        ),
         filename=file_path.name,
+        stat_result=file_stat,
     )
 
 
+async def _resolve_eval_file(
+    run_id: str, eval_path: str, current_user: Optional[User]
+) -> Path:
+    """Check access to a run's .eval file and return its resolved path."""
+    user_id = current_user.user_id if current_user else None
+    run = await run_store.get_run(run_id, user_id=user_id)
+    if run is None:
+        raise RunNotFoundError(run_id)
+    
+    # Build the full path and validate
+    artifact_dir = _RUNS_DIR_REAL / run_id
+    file_path = artifact_dir / eval_path
+    
+    # Security check
+    try:
+        file_path = file_path.resolve()
+        if not file_path.is_relative_to(artifact_dir):
+            raise ForbiddenError(
+                message="Access to this file is not allowed",
+                detail="The requested path is outside the run directory."
+            )
+    except ForbiddenError:
+        raise
+    except Exception:
+        raise ForbiddenError(
+            message="Invalid file path",
+            detail="The requested path could not be resolved."
+        )
+    
+    if not file_path.exists() or not file_path.is_file():
+        raise NotFoundError(
+            resource="Eval file",
+            detail=f"File '{eval_path}' not found. The benchmark may not have completed yet."
+        )
+    
+    # Only allow .eval files
+    if not file_path.suffix == '.eval':
+        raise ValidationError(
+            message="Only .eval files can be parsed in the browser",
+            detail="Download the file to view it with another tool."
+        )
+    
+    return file_path
+
+
+def _eval_metadata(log) -> dict:
+    """Extract the metadata and aggregate metrics of an eval log."""
+    result = {
+        "status": log.status if hasattr(log, 'status') else None,
+        "eval_name": log.eval.task if hasattr(log.eval, 'task') else None,
+        "model": log.eval.model if hasattr(log.eval, 'model') else None,
+        "dataset": log.eval.dataset.name if hasattr(log.eval, 'dataset') and log.eval.dataset else None,
+        "created": str(log.eval.created) if hasattr(log.eval, 'created') and log.eval.created else None,
+        "completed": str(log.eval.completed) if hasattr(log.eval, 'completed') and log.eval.completed else None,
+        "total_samples": len(log.samples) if hasattr(log, 'samples') and log.samples else 0,
+        "metrics": {},
+        "samples": [],
+        "config": {
+            "limit": log.eval.config.limit if hasattr(log.eval, 'config') and hasattr(log.eval.config, 'limit') else None,
+            "epochs": log.eval.config.epochs if hasattr(log.eval, 'config') and hasattr(log.eval.config, 'epochs') else None,
+        }
+    }
+    
+    # Extract metrics (scores)
+    if log.results and log.results.scores:
+        for score in log.results.scores:
+            # EvalScore has metrics dictionary, not a direct value
+            if hasattr(score, 'metrics') and score.metrics:
+                for metric_name, metric_data in score.metrics.items():
+                    # metric_data is an EvalMetric object
+                    result["metrics"][metric_name] = {
+                        "value": float(metric_data.value) if metric_data.value is not None else None,
+                        "name": metric_data.name if hasattr(metric_data, 'name') else metric_name,
+                        "reducer": score.reducer if hasattr(score, 'reducer') else None,
+                    }
+    
+    return result
+
+
+def _eval_sample_data(sample, index: int) -> dict:
+    """Extract the display fields of one eval sample."""
+    sample_data = {
+        "id": sample.id if hasattr(sample, 'id') else index,
+        "epoch": sample.epoch if hasattr(sample, 'epoch') else 1,
+        "input": str(sample.input)[:500] if sample.input else None,  # Truncate long inputs
+        "target": str(sample.target)[:500] if sample.target else None,
+        "output": None,
+        "score": None,
+        "error": sample.error if hasattr(sample, 'error') and sample.error else None,
+    }
+    
+    # Extract output from the last message
+    if sample.messages and len(sample.messages) > 0:
+        last_msg = sample.messages[-1]
+        if hasattr(last_msg, 'content'):
+            sample_data["output"] = str(last_msg.content)[:500]  # Truncate
+    
+    # Extract score
+    if sample.scores:
+        # sample.scores is a dictionary of scorer_name -> score_data
+        if isinstance(sample.scores, dict):
+            # Get the first score from the dictionary
+            score_name, score_data = next(iter(sample.scores.items()))
+            if isinstance(score_data, dict):
+                # Try to convert value to float, handle cases where it's a string
+                score_value = None
+                try:
+                    if score_data.get('value') is not None:
+                        score_value = float(score_data['value'])
+                except (ValueError, TypeError):
+                    # If value is not numeric (e.g., "C"), compute correctness score
+                    # by comparing answer to target (1.0 if match, 0.0 if not)
+                    if 'answer' in score_data and sample.target:
+                        score_value = 1.0 if str(score_data['answer']) == str(sample.target) else 0.0
+                
+                sample_data["score"] = {
+                    "value": score_value,
+                    "name": score_name,
+                    "explanation": score_data.get('explanation'),
+                }
+        elif hasattr(sample.scores, 'value'):
+            # Fallback for older formats
+            score_value = None
+            try:
+                if sample.scores.value is not None:
+                    score_value = float(sample.scores.value)
+            except (ValueError, TypeError):
+                # If value is not numeric, try to compute from answer/target
+                if hasattr(sample.scores, 'answer') and sample.target:
+                    score_value = 1.0 if str(sample.scores.answer) == str(sample.target) else 0.0
+            
+            sample_data["score"] = {
+                "value": score_value,
+                "name": sample.scores.name if hasattr(sample.scores, 'name') else "score",
+                "explanation": sample.scores.explanation if hasattr(sample.scores, 'explanation') else None,
+            }
+    
+    return sample_data
+
+
+# Samples parsed per worker-thread hop when streaming eval data
+EVAL_STREAM_BATCH_SIZE = 20
+
+
+def _next_samples(samples, count: int, lock: threading.Lock) -> list:
+    """Take up to count samples from a sample iterator (blocking)."""
+    with lock:
+        return list(itertools.islice(samples, count))
+
+
+def _close_samples(samples, lock: threading.Lock) -> None:
+    """Close a sample iterator once no batch is being read from it (blocking)."""
+    with lock:
+        samples.close()
+
+
+@router.get(
+    "/runs/{run_id}/eval-data/{eval_path:path}/stream",
+    summary="Stream parsed eval data",
+    description=(
+        "Stream an .eval file as newline-delimited JSON: the evaluation "
+        "metadata first, then one line per sample (all samples, parsed "
+        "incrementally)."
+    ),
+    responses={
+        200: {
+            "description": "Eval metadata followed by one sample per line",
+            "content": {"application/x-ndjson": {}},
+        },
+        403: {
+            "description": "Access forbidden",
+        },
+        404: {
+            "description": "Run or eval file not found",
+        },
+        422: {
+            "description": "Only .eval files can be parsed",
+        },
+        500: {
+            "description": "Failed to parse evaluation results",
+        },
+        502: {
+            "description": "inspect_ai package not available",
+        }
+    }
+)
+async def stream_eval_data(
+    run_id: str,
+    eval_path: str,
+    current_user: Optional[User] = Depends(get_optional_user),
+):
+    """
+    Stream parsed data from an .eval file.
+    
+    Unlike the eval-data endpoint, samples are read from the file one batch
+    at a time, so large evaluations are never held in memory whole and the
+    first samples arrive before the rest are parsed. Every sample is
+    included.
+    
+    Authentication is optional for this endpoint.
+    """
+    file_path = await _resolve_eval_file(run_id, eval_path, current_user)
+    
+    # Read the header up front so errors can still become error responses
+    try:
+        from inspect_ai.log import read_eval_log, read_eval_log_samples
+        
+        loop = asyncio.get_running_loop()
+        header = await loop.run_in_executor(
+            None, functools.partial(read_eval_log, str(file_path), header_only=True)
+        )
+        metadata = _eval_metadata(header)
+    except ImportError as e:
+        raise ExternalServiceError(
+            service="inspect_ai",
+            detail=f"The inspect_ai package is required to view evaluation results but is not installed: {str(e)}"
+        )
+    except Exception as e:
+        raise ServerError(
+            message="Failed to parse evaluation results",
+            detail=f"The evaluation file could not be parsed: {str(e)}. The file may be corrupted or in an unexpected format."
+        )
+    # The header does not carry the samples, only their count
+    del metadata["samples"]
+    metadata["total_samples"] = header.results.total_samples if header.results else 0
+    
+    async def sample_lines() -> AsyncGenerator[bytes, None]:
+        yield to_json(metadata) + b"\n"
+        samples = read_eval_log_samples(str(file_path))
+        # Held while a worker thread reads from or closes the samples
+        lock = threading.Lock()
+        index = 0
+        try:
+            while True:
+                batch = await loop.run_in_executor(
+                    None, _next_samples, samples, EVAL_STREAM_BATCH_SIZE, lock
+                )
+                if not batch:
+                    break
+                for sample in batch:
+                    yield to_json(_eval_sample_data(sample, index)) + b"\n"
+                    index += 1
+        except Exception:
+            # Headers are already sent, so the stream can only end early
+            import traceback
+            traceback.print_exc()
+        finally:
+            # If the client went away mid-read, a batch may still be reading in
+            # a worker thread; the close waits for it there instead of here
+            loop.run_in_executor(None, _close_samples, samples, lock)
+    
+    return StreamingResponse(sample_lines(), media_type="application/x-ndjson")
+
+
 @router.get(
     "/runs/{run_id}/eval-data/{eval_path:path}",
     summary="Get parsed eval data",
@@ -1352,44 +1677,14 @@ async def get_eval_data(
     
     Authentication is optional for this endpoint.
     """
-    user_id = current_user.user_id if current_user else None
-    run = await run_store.get_run(run_id, user_id=user_id)
-    if run is None:
-        raise RunNotFoundError(run_id)
+    file_path = await _resolve_eval_file(run_id, eval_path, current_user)
     
-    # Build the full path and validate
-    artifact_dir = RUNS_DIR / run_id
-    file_path = artifact_dir / eval_path
-    
-    # Security check
-    try:
-        file_path = file_path.resolve()
-        artifact_dir = artifact_dir.resolve()
-        if not str(file_path).startswith(str(artifact_dir)):
-            raise ForbiddenError(
-                message="Access to this file is not allowed",
-                detail="The requested path is outside the run directory."
-            )
-    except ForbiddenError:
-        raise
-    except Exception:
-        raise ForbiddenError(
-            message="Invalid file path",
-            detail="The requested path could not be resolved."
-        )
-    
-    if not file_path.exists() or not file_path.is_file():
-        raise NotFoundError(
-            resource="Eval file",
-            detail=f"File '{eval_path}' not found. The benchmark may not have completed yet."
-        )
-    
-    # Only allow .eval files
-    if not file_path.suffix == '.eval':
-        raise ValidationError(
-            message="Only .eval files can be parsed in the browser",
-            detail="Download the file to view it with another tool."
-        )
+    file_stat = file_path.stat()
+    cache_key = (str(file_path), file_stat.st_mtime_ns, file_stat.st_size)
+    cached = _eval_data_cache.pop(cache_key, None)
+    if cached is not None:
+        _eval_data_cache[cache_key] = cached
+        return cached
     
     try:
         # Import inspect_ai to read the eval log
@@ -1405,96 +1700,16 @@ async def get_eval_data(
         log = await loop.run_in_executor(None, _read_log)
         
         # Extract key information
-        result = {
-            "status": log.status if hasattr(log, 'status') else None,
-            "eval_name": log.eval.task if hasattr(log.eval, 'task') else None,
-            "model": log.eval.model if hasattr(log.eval, 'model') else None,
-            "dataset": log.eval.dataset.name if hasattr(log.eval, 'dataset') and log.eval.dataset else None,
-            "created": str(log.eval.created) if hasattr(log.eval, 'created') and log.eval.created else None,
-            "completed": str(log.eval.completed) if hasattr(log.eval, 'completed') and log.eval.completed else None,
-            "total_samples": len(log.samples) if hasattr(log, 'samples') and log.samples else 0,
-            "metrics": {},
-            "samples": [],
-            "config": {
-                "limit": log.eval.config.limit if hasattr(log.eval, 'config') and hasattr(log.eval.config, 'limit') else None,
-                "epochs": log.eval.config.epochs if hasattr(log.eval, 'config') and hasattr(log.eval.config, 'epochs') else None,
-            }
-        }
-        
-        # Extract metrics (scores)
-        if log.results and log.results.scores:
-            for score in log.results.scores:
-                # EvalScore has metrics dictionary, not a direct value
-                if hasattr(score, 'metrics') and score.metrics:
-                    for metric_name, metric_data in score.metrics.items():
-                        # metric_data is an EvalMetric object
-                        result["metrics"][metric_name] = {
-                            "value": float(metric_data.value) if metric_data.value is not None else None,
-                            "name": metric_data.name if hasattr(metric_data, 'name') else metric_name,
-                            "reducer": score.reducer if hasattr(score, 'reducer') else None,
-                        }
+        result = _eval_metadata(log)
         
         # Extract sample information (limit to first 100 for performance)
         if log.samples:
             for i, sample in enumerate(log.samples[:100]):
-                sample_data = {
-                    "id": sample.id if hasattr(sample, 'id') else i,
-                    "epoch": sample.epoch if hasattr(sample, 'epoch') else 1,
-                    "input": str(sample.input)[:500] if sample.input else None,  # Truncate long inputs
-                    "target": str(sample.target)[:500] if sample.target else None,
-                    "output": None,
-                    "score": None,
-                    "error": sample.error if hasattr(sample, 'error') and sample.error else None,
-                }
-                
-                # Extract output from the last message
-                if sample.messages and len(sample.messages) > 0:
-                    last_msg = sample.messages[-1]
-                    if hasattr(last_msg, 'content'):
-                        sample_data["output"] = str(last_msg.content)[:500]  # Truncate
-                
-                # Extract score
-                if sample.scores:
-                    # sample.scores is a dictionary of scorer_name -> score_data
-                    if isinstance(sample.scores, dict):
-                        # Get the first score from the dictionary
-                        score_name, score_data = next(iter(sample.scores.items()))
-                        if isinstance(score_data, dict):
-                            # Try to convert value to float, handle cases where it's a string
-                            score_value = None
-                            try:
-                                if score_data.get('value') is not None:
-                                    score_value = float(score_data['value'])
-                            except (ValueError, TypeError):
-                                # If value is not numeric (e.g., "C"), compute correctness score
-                                # by comparing answer to target (1.0 if match, 0.0 if not)
-                                if 'answer' in score_data and sample.target:
-                                    score_value = 1.0 if str(score_data['answer']) == str(sample.target) else 0.0
-                            
-                            sample_data["score"] = {
-                                "value": score_value,
-                                "name": score_name,
-                                "explanation": score_data.get('explanation'),
-                            }
-                    elif hasattr(sample.scores, 'value'):
-                        # Fallback for older formats
-                        score_value = None
-                        try:
-                            if sample.scores.value is not None:
-                                score_value = float(sample.scores.value)
-                        except (ValueError, TypeError):
-                            # If value is not numeric, try to compute from answer/target
-                            if hasattr(sample.scores, 'answer') and sample.target:
-                                score_value = 1.0 if str(sample.scores.answer) == str(sample.target) else 0.0
-                        
-                        sample_data["score"] = {
-                            "value": score_value,
-                            "name": sample.scores.name if hasattr(sample.scores, 'name') else "score",
-                            "explanation": sample.scores.explanation if hasattr(sample.scores, 'explanation') else None,
-                        }
-                
-                result["samples"].append(sample_data)
+                result["samples"].append(_eval_sample_data(sample, i))
         
+        _eval_data_cache[cache_key] = result
+        if len(_eval_data_cache) > EVAL_DATA_CACHE_SIZE:
+            del _eval_data_cache[next(iter(_eval_data_cache))]
         return result
         
     except ImportError as e:
@@ -20,7 +20,7 @@ from pydantic import BaseModel, Field
 
 from app.core.auth import get_current_user
 from app.core.errors import ValidationError
-from app.db.models import User, ApiKeyCreate, PREDEFINED_PROVIDERS, get_env_var_for_provider
+from app.db.models import User, ApiKeyCreate, PROVIDER_DISPLAY_NAMES, get_env_var_for_provider
 from app.services.api_keys import api_key_service, decrypt_api_key
 
 router = APIRouter()
@@ -273,10 +273,7 @@ async def preview_import(
             continue
         
         # Get display info
-        if provider in PREDEFINED_PROVIDERS:
-            display_name = PREDEFINED_PROVIDERS[provider]["display_name"]
-        else:
-            display_name = provider
+        display_name = PROVIDER_DISPLAY_NAMES.get(provider, provider)
         
         api_keys_preview.append({
             "provider": provider,
@@ -394,10 +391,7 @@ async def import_settings(
             )
             imported_count += 1
             
-            if provider in PREDEFINED_PROVIDERS:
-                display_name = PREDEFINED_PROVIDERS[provider]["display_name"]
-            else:
-                display_name = provider
+            display_name = PROVIDER_DISPLAY_NAMES.get(provider, provider)
             details.append(f"Imported: {display_name}")
         except Exception as e:
             skipped_count += 1
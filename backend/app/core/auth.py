@@ -2,9 +2,10 @@
 Authentication dependencies for FastAPI routes.
 """
 
-from typing import Optional
+import time
+from typing import Dict, Optional, Tuple
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from app.db.models import User
@@ -14,15 +15,56 @@ from app.services.auth import auth_service, decode_access_token
 # HTTP Bearer token security
 security = HTTPBearer(auto_error=False)
 
+# Authenticated users cached by bearer token, so repeated requests from one
+# client skip the JWT decode and user lookup. Entries never outlive the token.
+USER_CACHE_TTL_SECONDS = 30
+USER_CACHE_MAX_SIZE = 10_000
+_user_cache: Dict[str, Tuple[User, float]] = {}
+
+
+def _get_cached_user(token: str) -> Optional[User]:
+    """Get the cached user for a token, if the entry is still fresh."""
+    entry = _user_cache.get(token)
+    if entry is None:
+        return None
+    user, expires_at = entry
+    if expires_at <= time.time():
+        _user_cache.pop(token, None)
+        return None
+    return user
+
+
+def _cache_user(token: str, user: User, token_exp: Optional[int]) -> None:
+    """Cache an authenticated user until the TTL or the token expires."""
+    now = time.time()
+    if len(_user_cache) >= USER_CACHE_MAX_SIZE:
+        for key in [k for k, (_, exp) in _user_cache.items() if exp <= now]:
+            del _user_cache[key]
+        if len(_user_cache) >= USER_CACHE_MAX_SIZE:
+            _user_cache.clear()
+    
+    expires_at = now + USER_CACHE_TTL_SECONDS
+    if token_exp is not None:
+        expires_at = min(expires_at, token_exp)
+    _user_cache[token] = (user, expires_at)
+
 
 async def get_current_user(
+    request: Request,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
 ) -> User:
     """
     Dependency that extracts and validates the current user from the JWT token.
     
+    The user is stored on ``request.state`` so other auth dependencies in the
+    same request reuse it.
+    
     Raises HTTPException 401 if token is missing or invalid.
     """
+    user = getattr(request.state, "user", None)
+    if user is not None:
+        return user
+    
     if credentials is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -30,6 +72,11 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    user = _get_cached_user(credentials.credentials)
+    if user is not None:
+        request.state.user = user
+        return user
+    
     token_data = decode_access_token(credentials.credentials)
     if token_data is None:
         raise HTTPException(
@@ -52,10 +99,13 @@ async def get_current_user(
             detail="User account is disabled",
         )
     
+    _cache_user(credentials.credentials, user, token_data.exp)
+    request.state.user = user
     return user
 
 
 async def get_optional_user(
+    request: Request,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
 ) -> Optional[User]:
     """
@@ -63,9 +113,18 @@ async def get_optional_user(
     
     Useful for endpoints that work differently for authenticated vs anonymous users.
     """
+    user = getattr(request.state, "user", None)
+    if user is not None:
+        return user
+    
     if credentials is None:
         return None
     
+    user = _get_cached_user(credentials.credentials)
+    if user is not None:
+        request.state.user = user
+        return user
+    
     token_data = decode_access_token(credentials.credentials)
     if token_data is None:
         return None
@@ -74,6 +133,8 @@ async def get_optional_user(
     if user is None or not user.is_active:
         return None
     
+    _cache_user(credentials.credentials, user, token_data.exp)
+    request.state.user = user
     return user
 
 
@@ -256,6 +256,19 @@ class ValidationError(APIError):
         )
 
 
+class InvalidCursorError(APIError):
+    """Pagination cursor that does not identify an entry of the listing."""
+    
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            code=ErrorCode.VALIDATION_FIELD_INVALID,
+            message="Invalid pagination cursor",
+            detail="The cursor must be the ID of an entry from a previous page.",
+            field="cursor",
+        )
+
+
 class ConflictError(APIError):
     """Resource conflict."""
     
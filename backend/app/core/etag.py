@@ -0,0 +1,24 @@
+"""
+ETag helpers for conditional GETs on pre-serialized responses.
+
+Provides:
+- Strong ETags computed from response bytes
+- If-None-Match matching so unchanged payloads can be answered with a 304
+"""
+
+import hashlib
+
+from fastapi import Request
+
+
+def make_etag(payload: bytes) -> str:
+    """Build a strong (quoted) ETag from a response body."""
+    return f'"{hashlib.sha256(payload).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match header lists the given ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return etag in (tag.strip() for tag in if_none_match.split(","))
@@ -15,9 +15,10 @@ from alembic import command
 from alembic.config import Config
 from alembic.runtime.migration import MigrationContext
 from alembic.script import ScriptDirectory
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
 
 from app.core.config import DATABASE_PATH
+from app.db.sa_models import Base
 
 logger = logging.getLogger(__name__)
 
@@ -57,7 +58,7 @@ def run_migrations() -> None:
     Run all pending database migrations.
     
     This function is safe to call on every app startup. It will:
-    - Create the database if it doesn't exist
+    - Create the database at the head schema if it doesn't exist
     - Apply any pending migrations
     - Do nothing if the database is already up to date
     """
@@ -66,31 +67,38 @@ def run_migrations() -> None:
     # Ensure data directory exists
     DATABASE_PATH.parent.mkdir(parents=True, exist_ok=True)
     
-    current = get_current_revision()
-    head = get_head_revision()
-    
-    if current is None:
-        # Fresh database - check if tables exist from old init_db
-        engine = create_engine(f"sqlite:///{DATABASE_PATH}")
-        from sqlalchemy import inspect
-        inspector = inspect(engine)
-        tables = inspector.get_table_names()
+    # One engine and connection serve the revision check, the table listing
+    # and (for fresh databases) schema creation
+    engine = create_engine(f"sqlite:///{DATABASE_PATH}")
+    try:
+        with engine.connect() as connection:
+            current = MigrationContext.configure(connection).get_current_revision()
+            # Only a database without Alembic tracking needs to be inspected
+            tables = inspect(connection).get_table_names() if current is None else []
+        head = ScriptDirectory.from_config(config).get_current_head()
         
-        if tables and 'users' in tables:
-            # Existing database without Alembic tracking
-            # Stamp it with the current head to mark migrations as applied
-            logger.info("Existing database detected, stamping with current migration head")
-            command.stamp(config, "head")
-        else:
-            # Fresh database - run all migrations
-            logger.info("Fresh database, running all migrations")
+        if current is None:
+            # Fresh database - check if tables exist from old init_db
+            if tables and 'users' in tables:
+                # Existing database without Alembic tracking
+                # Stamp it with the current head to mark migrations as applied
+                logger.info("Existing database detected, stamping with current migration head")
+                command.stamp(config, "head")
+            else:
+                # Fresh database - create the head schema in one pass from the
+                # SQLAlchemy models and stamp it, instead of replaying every
+                # migration (each of which reflects and alters the schema)
+                logger.info("Fresh database, creating schema at migration head")
+                Base.metadata.create_all(engine)
+                command.stamp(config, "head")
+        elif current != head:
+            # Database exists but needs migrations
+            logger.info(f"Upgrading database from {current} to {head}")
             command.upgrade(config, "head")
-    elif current != head:
-        # Database exists but needs migrations
-        logger.info(f"Upgrading database from {current} to {head}")
-        command.upgrade(config, "head")
-    else:
-        logger.debug("Database is up to date")
+        else:
+            logger.debug("Database is up to date")
+    finally:
+        engine.dispose()
 
 
 def stamp_head() -> None:
@@ -1,10 +1,28 @@
 from datetime import datetime
 from enum import Enum
-from typing import Optional
-from pydantic import BaseModel, Field, EmailStr, ConfigDict
+from typing import Annotated, Optional
+from pydantic import AfterValidator, BaseModel, Field, ConfigDict, WithJsonSchema
 import uuid
 
 
+def _validate_email(value: str) -> str:
+    """Validate and normalize an email address like ``EmailStr`` does.
+    
+    ``EmailStr`` imports email-validator when the model class is built; going
+    through pydantic's ``validate_email`` defers that import to the first
+    request that carries an email.
+    """
+    from pydantic.networks import validate_email
+    return validate_email(value)[1]
+
+
+EmailAddress = Annotated[
+    str,
+    AfterValidator(_validate_email),
+    WithJsonSchema({"type": "string", "format": "email"}),
+]
+
+
 # =============================================================================
 # User Models
 # =============================================================================
@@ -30,7 +48,7 @@ class UserCreate(BaseModel):
         }
     )
     
-    email: EmailStr = Field(
+    email: EmailAddress = Field(
         description="User's email address (must be unique)",
         examples=["user@example.com"]
     )
@@ -53,7 +71,7 @@ class UserLogin(BaseModel):
         }
     )
     
-    email: EmailStr = Field(
+    email: EmailAddress = Field(
         description="Registered email address",
         examples=["user@example.com"]
     )
@@ -103,6 +121,7 @@ class TokenData(BaseModel):
     """Data encoded in the JWT."""
     user_id: str
     email: str
+    exp: Optional[int] = None  # Expiry as a Unix timestamp
 
 
 # =============================================================================
@@ -150,6 +169,10 @@ PREDEFINED_PROVIDERS = {
     "fireworks": {"display_name": "Fireworks", "env_var": "FIREWORKS_API_KEY", "color": "#ef4444"},
 }
 
+# Flat per-field lookups, built once from PREDEFINED_PROVIDERS
+PROVIDER_ENV_VARS = {provider: info["env_var"] for provider, info in PREDEFINED_PROVIDERS.items()}
+PROVIDER_DISPLAY_NAMES = {provider: info["display_name"] for provider, info in PREDEFINED_PROVIDERS.items()}
+
 
 def get_env_var_for_provider(provider: str, custom_env_var: Optional[str] = None) -> str:
     """
@@ -165,8 +188,9 @@ def get_env_var_for_provider(provider: str, custom_env_var: Optional[str] = None
     if custom_env_var:
         return custom_env_var
     
-    if provider in PREDEFINED_PROVIDERS:
-        return PREDEFINED_PROVIDERS[provider]["env_var"]
+    env_var = PROVIDER_ENV_VARS.get(provider)
+    if env_var:
+        return env_var
     
     # For custom providers, generate env var name from provider ID
     return f"{provider.upper().replace('-', '_').replace(' ', '_')}_API_KEY"
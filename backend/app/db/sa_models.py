@@ -2,8 +2,15 @@
 SQLAlchemy ORM models for database schema.
 
 These models define the actual database schema and are used by Alembic
-for migrations. The Pydantic models in models.py are used for API
-validation and serialization.
+for migrations. They must match the schema produced by the migration chain
+at head: fresh databases are created directly from this metadata and then
+stamped (see app.db.migrations). The Pydantic models in models.py are used
+for API validation and serialization.
+
+IDs are UUID strings and timestamps are ISO 8601 strings, both stored as
+plain String columns: the application reads and writes them with raw SQL
+through aiosqlite, and SQLite stores any declared type with TEXT affinity
+anyway.
 """
 
 from datetime import datetime
@@ -16,7 +23,9 @@ from sqlalchemy import (
     Boolean,
     DateTime,
     ForeignKey,
+    Index,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.orm import DeclarativeBase, relationship
 
@@ -34,7 +43,12 @@ class User(Base):
     email = Column(String, unique=True, nullable=False, index=True)
     hashed_password = Column(String, nullable=False)
     created_at = Column(String, nullable=False)  # ISO format string
-    is_active = Column(Integer, nullable=False, default=1)
+    is_active = Column(Integer, nullable=False, server_default="1")
+
+    # Constraints
+    __table_args__ = (
+        UniqueConstraint("email"),
+    )
 
     # Relationships
     api_keys = relationship("ApiKey", back_populates="user", cascade="all, delete-orphan")
@@ -69,23 +83,23 @@ class Run(Base):
     __tablename__ = "runs"
 
     run_id = Column(String, primary_key=True)
-    user_id = Column(String, ForeignKey("users.user_id"), nullable=True, index=True)
-    benchmark = Column(String, nullable=False, index=True)
+    user_id = Column(String, ForeignKey("users.user_id"), nullable=True)
+    benchmark = Column(String, nullable=False)
     model = Column(String, nullable=False, index=True)
-    status = Column(String, nullable=False, default="queued", index=True)
+    status = Column(String, nullable=False, server_default="queued")
     created_at = Column(String, nullable=False)
     started_at = Column(String, nullable=True)
     finished_at = Column(String, nullable=True)
-    scheduled_for = Column(String, nullable=True, index=True)  # ISO format datetime for scheduled runs
+    scheduled_for = Column(String, nullable=True)  # ISO format datetime for scheduled runs
     artifact_dir = Column(String, nullable=True)
     exit_code = Column(Integer, nullable=True)
     error = Column(Text, nullable=True)
     config_json = Column(Text, nullable=True)
     primary_metric = Column(Float, nullable=True)
     primary_metric_name = Column(String, nullable=True)
-    tags_json = Column(Text, nullable=True, default="[]")
+    tags_json = Column(Text, nullable=True, server_default="[]")
     notes = Column(Text, nullable=True)  # User notes for the run
-    template_id = Column(String, ForeignKey("run_templates.template_id"), nullable=True, index=True)
+    template_id = Column(String, nullable=True, index=True)  # No FK: runs outlive their template
     template_name = Column(String, nullable=True)  # Denormalized for display even if template deleted
     
     # Cost tracking fields
@@ -94,9 +108,30 @@ class Run(Base):
     total_tokens = Column(Integer, nullable=True)  # Total tokens used
     estimated_cost = Column(Float, nullable=True)  # Estimated cost in USD
 
+    # Composite indexes for common list/filter queries. They also serve
+    # lookups on their leading column, so user_id, status and benchmark have
+    # no single-column index of their own.
+    __table_args__ = (
+        Index("ix_runs_user_created", "user_id", "created_at"),
+        Index("ix_runs_created_at_desc", "created_at"),
+        Index("ix_runs_status_created", "status", "created_at"),
+        Index("ix_runs_benchmark_created", "benchmark", "created_at"),
+        # Partial index covering only scheduled runs, for the scheduler poll
+        Index(
+            "ix_runs_scheduled_pending",
+            "status",
+            "scheduled_for",
+            sqlite_where=text("scheduled_for IS NOT NULL"),
+        ),
+    )
+
     # Relationships
     user = relationship("User", back_populates="runs")
-    template = relationship("RunTemplate", back_populates="runs")
+    template = relationship(
+        "RunTemplate",
+        back_populates="runs",
+        primaryjoin="foreign(Run.template_id) == RunTemplate.template_id",
+    )
 
 
 class RunTemplate(Base):
@@ -114,7 +149,11 @@ class RunTemplate(Base):
 
     # Relationships
     user = relationship("User", back_populates="templates")
-    runs = relationship("Run", back_populates="template")
+    runs = relationship(
+        "Run",
+        back_populates="template",
+        primaryjoin="foreign(Run.template_id) == RunTemplate.template_id",
+    )
 
 
 class NotificationSettings(Base):
@@ -122,14 +161,18 @@ class NotificationSettings(Base):
     __tablename__ = "notification_settings"
 
     settings_id = Column(String, primary_key=True)
-    user_id = Column(String, ForeignKey("users.user_id"), nullable=False, unique=True, index=True)
+    user_id = Column(String, ForeignKey("users.user_id"), nullable=False)
     webhook_url = Column(String, nullable=True)
-    webhook_enabled = Column(Integer, nullable=False, default=0)  # SQLite boolean
-    notify_on_complete = Column(Integer, nullable=False, default=1)  # SQLite boolean
-    notify_on_failure = Column(Integer, nullable=False, default=1)  # SQLite boolean
+    webhook_enabled = Column(Integer, nullable=False, server_default="0")  # SQLite boolean
+    notify_on_complete = Column(Integer, nullable=False, server_default="1")  # SQLite boolean
+    notify_on_failure = Column(Integer, nullable=False, server_default="1")  # SQLite boolean
     created_at = Column(String, nullable=False)
     updated_at = Column(String, nullable=False)
 
+    __table_args__ = (
+        UniqueConstraint("user_id", name="uix_notification_settings_user"),
+    )
+
     # Relationships
     user = relationship("User")
 
@@ -139,16 +182,29 @@ class WebhookLog(Base):
     __tablename__ = "webhook_logs"
 
     log_id = Column(String, primary_key=True)
-    user_id = Column(String, ForeignKey("users.user_id"), nullable=False, index=True)
+    user_id = Column(String, ForeignKey("users.user_id"), nullable=False)
     run_id = Column(String, nullable=True, index=True)
     event_type = Column(String, nullable=False)  # run_completed, run_failed, test
     webhook_url = Column(String, nullable=False)
     status = Column(String, nullable=False)  # success, failed
     status_code = Column(Integer, nullable=True)
     error_message = Column(Text, nullable=True)
-    attempt_count = Column(Integer, nullable=False, default=1)
+    attempt_count = Column(Integer, nullable=False, server_default="1")
     payload_json = Column(Text, nullable=True)
     created_at = Column(String, nullable=False)
 
+    __table_args__ = (
+        Index("ix_webhook_logs_user_created", "user_id", "created_at", "log_id"),
+        Index(
+            "ix_webhook_logs_user_event_status",
+            "user_id",
+            "event_type",
+            "status",
+            "created_at",
+            "log_id",
+        ),
+        Index("ix_webhook_logs_user_status", "user_id", "status", "created_at", "log_id"),
+    )
+
     # Relationships
     user = relationship("User")
@@ -0,0 +1,117 @@
+"""
+Cached schema reflection for Alembic migrations.
+
+Migration scripts guard their DDL with existence checks (does this table,
+column or index already exist?). Reflecting the database for every check
+costs a round trip per call, so this module keeps a single snapshot per
+connection; migrations use IF NOT EXISTS DDL wherever the
+database supports it and only consult the snapshot where it does not.
+
+The snapshot is stored in the connection's ``info`` dict, so every migration
+in a single ``alembic upgrade`` run shares it. Migrations that create or
+alter objects under a guard must record the change (``add_table``,
+``add_column``, ``add_index``, ``remove_index``) so later migrations in the
+same run see it.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import Column, Table, inspect
+from sqlalchemy.engine import Connection
+from sqlalchemy.engine.reflection import Inspector
+
+_INFO_KEY = "openbench_schema_cache"
+
+
+class SchemaCache:
+    """Snapshot of the tables, columns and indexes of a database.
+
+    The whole schema is reflected in one batch on first use (SQLAlchemy's
+    ``get_multi_columns`` API) rather than table by table. Indexes are
+    reflected the same way, but only once a migration first asks for them.
+    """
+
+    def __init__(self, bind: Connection):
+        self._inspector: Inspector = inspect(bind)
+        self._tables: Optional[Set[str]] = None
+        self._columns: Dict[str, Set[str]] = {}
+        self._indexes: Optional[Dict[str, Set[str]]] = None
+
+    def _load(self) -> Set[str]:
+        if self._tables is None:
+            self._tables = set(self._inspector.get_table_names())
+            self._columns = {
+                table: {col["name"] for col in cols}
+                for (_, table), cols in self._inspector.get_multi_columns().items()
+            }
+        return self._tables
+
+    def tables(self) -> Set[str]:
+        """Names of all tables in the database."""
+        return self._load()
+
+    def columns(self, table_name: str) -> Set[str]:
+        """Names of all columns in a table (empty if the table does not exist)."""
+        self._load()
+        return self._columns.setdefault(table_name, set())
+
+    def indexes(self, table_name: str) -> Set[str]:
+        """Names of all indexes on a table (empty if the table does not exist)."""
+        if self._indexes is None:
+            # The inspector memoizes the table list it saw on first use, which
+            # predates tables created by earlier migrations in this run
+            self._inspector.clear_cache()
+            self._indexes = {
+                table: {ix["name"] for ix in ixs}
+                for (_, table), ixs in self._inspector.get_multi_indexes().items()
+            }
+        return self._indexes.setdefault(table_name, set())
+
+    def has_table(self, table_name: str) -> bool:
+        """Check if a table exists in the database."""
+        return table_name in self.tables()
+
+    def has_column(self, table_name: str, column_name: str) -> bool:
+        """Check if a column exists in a table."""
+        return column_name in self.columns(table_name)
+
+    def has_index(self, table_name: str, index_name: str) -> bool:
+        """Check if an index exists on a table."""
+        return index_name in self.indexes(table_name)
+
+    def missing_columns(self, table_name: str, columns: Iterable[Column]) -> List[Column]:
+        """The subset of ``columns`` not yet present in a table."""
+        existing = self.columns(table_name)
+        return [col for col in columns if col.name not in existing]
+
+    def add_table(self, table: Table) -> None:
+        """Record a table created by a migration."""
+        self.tables().add(table.name)
+        self._columns[table.name] = {col.name for col in table.columns}
+
+    def add_column(self, table_name: str, column_name: str) -> None:
+        """Record a column added by a migration."""
+        self.columns(table_name).add(column_name)
+
+    def add_index(self, table_name: str, index_name: str) -> None:
+        """Record an index created by a migration."""
+        self.indexes(table_name).add(index_name)
+
+    def remove_index(self, table_name: str, index_name: str) -> None:
+        """Record an index dropped by a migration."""
+        self.indexes(table_name).discard(index_name)
+
+
+def get_schema_cache(bind: Connection) -> SchemaCache:
+    """Get the schema snapshot for a connection, creating it on first use."""
+    cache = bind.info.get(_INFO_KEY)
+    if cache is None:
+        cache = bind.info[_INFO_KEY] = SchemaCache(bind)
+    return cache
+
+
+def clear_schema_cache(bind: Connection) -> None:
+    """Discard the schema snapshot for a connection."""
+    bind.info.pop(_INFO_KEY, None)
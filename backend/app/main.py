@@ -19,6 +19,8 @@ from app.api.routes import api_keys, auth, benchmarks, health, notifications, ru
 from app.core.config import API_PREFIX
 from app.core.rate_limit import limiter, rate_limit_exceeded_handler, RateLimitHeadersMiddleware
 from app.db.migrations import run_migrations
+from app.services.api_keys import init_encryption
+from app.services.notifications import notification_service
 
 logger = logging.getLogger(__name__)
 
@@ -84,6 +86,9 @@ async def lifespan(app: FastAPI):
         logger.exception("Migration failed")
         raise
     
+    # Derive the API key cipher before serving requests
+    init_encryption()
+    
     # Start the run scheduler
     try:
         print("[STARTUP] Importing scheduler...", flush=True)
@@ -104,6 +109,9 @@ async def lifespan(app: FastAPI):
     # Shutdown: stop the scheduler
     await scheduler.stop()
     logger.info("Run scheduler stopped")
+    
+    # Close pooled webhook connections
+    await notification_service.close()
 
 
 app = FastAPI(
@@ -1,4 +1,6 @@
+import io
 import json
+import os
 from pathlib import Path
 from typing import Any, Optional
 
@@ -13,16 +15,37 @@ def get_artifact_path(run_id: str, filename: str) -> Optional[Path]:
     return None
 
 
+# Log tails are read backwards from the end of the file in blocks of this size
+TAIL_BLOCK_SIZE = 8192
+
+
 def read_log_tail(run_id: str, log_name: str = "stdout.log", lines: int = 100) -> Optional[str]:
-    """Read the last N lines of a log file."""
+    """
+    Read the last N lines of a log file.
+    
+    Blocks are read from the end of the file until they hold enough lines,
+    so the cost depends on the size of the tail rather than of the log.
+    """
     path = get_artifact_path(run_id, log_name)
     if path is None:
         return None
     
     try:
-        with open(path, "r") as f:
-            all_lines = f.readlines()
-            return "".join(all_lines[-lines:])
+        chunks = []
+        newlines = 0
+        with open(path, "rb") as f:
+            position = f.seek(0, os.SEEK_END)
+            # One newline more than needed marks where the first line starts
+            while position > 0 and (lines <= 0 or newlines <= lines):
+                size = min(TAIL_BLOCK_SIZE, position)
+                position -= size
+                f.seek(position)
+                chunk = f.read(size)
+                chunks.append(chunk)
+                newlines += chunk.count(b"\n")
+        text = b"".join(reversed(chunks)).decode("utf-8", errors="replace")
+        all_lines = io.StringIO(text, newline=None).readlines()
+        return "".join(all_lines[-lines:])
     except Exception:
         return None
 
@@ -526,7 +526,7 @@ class RunExecutor:
                         started_at = run.started_at if isinstance(run.started_at, datetime) else datetime.fromisoformat(str(run.started_at))
                         duration_seconds = int((datetime.utcnow() - started_at).total_seconds())
                     
-                    await notification_service.send_run_notification(
+                    notification_service.queue_run_notification(
                         user_id=run.user_id,
                         run_id=run.run_id,
                         benchmark=run.benchmark,
@@ -556,7 +556,7 @@ class RunExecutor:
             # Send failure notification
             if run.user_id:
                 try:
-                    await notification_service.send_run_notification(
+                    notification_service.queue_run_notification(
                         user_id=run.user_id,
                         run_id=run.run_id,
                         benchmark=run.benchmark,
@@ -580,7 +580,7 @@ class RunExecutor:
             # Send failure notification
             if run.user_id:
                 try:
-                    await notification_service.send_run_notification(
+                    notification_service.queue_run_notification(
                         user_id=run.user_id,
                         run_id=run.run_id,
                         benchmark=run.benchmark,
@@ -5,8 +5,10 @@ Keys are encrypted at rest using AES-256 encryption.
 """
 
 import base64
-from datetime import datetime
-from typing import Optional
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, List, Optional
 
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
@@ -17,8 +19,12 @@ from app.db.models import ApiKey, ApiKeyCreate, ApiKeyPublic, get_env_var_for_pr
 from app.db.session import get_db
 
 
+@lru_cache(maxsize=1)
 def _get_fernet() -> Fernet:
-    """Get a Fernet instance for encryption/decryption."""
+    """Get the shared Fernet instance for encryption/decryption.
+
+    Key derivation is deliberately slow, so it runs once per process.
+    """
     # Derive a proper key from our secret using PBKDF2
     kdf = PBKDF2HMAC(
         algorithm=hashes.SHA256(),
@@ -30,6 +36,11 @@ def _get_fernet() -> Fernet:
     return Fernet(key)
 
 
+def init_encryption() -> None:
+    """Derive the encryption key up front so no request pays for it."""
+    _get_fernet()
+
+
 def encrypt_api_key(key: str) -> str:
     """Encrypt an API key for storage."""
     fernet = _get_fernet()
@@ -49,9 +60,46 @@ def get_key_preview(key: str) -> str:
     return f"...{key[-4:]}"
 
 
+# Columns needed for ApiKeyPublic; the ciphertext is never read for listings
+_PUBLIC_COLUMNS = "key_id, provider, key_preview, custom_env_var, created_at, updated_at"
+
+
+@dataclass
+class KeyListCacheEntry:
+    """Cached key list with expiration."""
+    keys: List[ApiKeyPublic]
+    expires_at: datetime
+
+
+@dataclass
+class RunEnvCacheEntry:
+    """Cached decrypted run environment with expiration."""
+    env_vars: Dict[str, str]
+    expires_at: datetime
+
+
 class ApiKeyService:
     """Service for managing API keys."""
 
+    # Key lists are cached briefly per user and cleared on every write
+    LIST_CACHE_TTL_SECONDS = 30
+    # Decrypted run environments are cached the same way, so a burst of
+    # runs from one user decrypts their keys once
+    RUN_ENV_CACHE_TTL_SECONDS = 60
+
+    def __init__(self):
+        self._list_cache: Dict[str, KeyListCacheEntry] = {}
+        self._run_env_cache: Dict[str, RunEnvCacheEntry] = {}
+        # Bumped on every invalidation; a cache fill that started before one
+        # (and so may have read the old keys) is not stored
+        self._generations: Dict[str, int] = {}
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop everything cached for a user after their keys change."""
+        self._generations[user_id] = self._generations.get(user_id, 0) + 1
+        self._list_cache.pop(user_id, None)
+        self._run_env_cache.pop(user_id, None)
+
     async def create_or_update_key(
         self, user_id: str, key_create: ApiKeyCreate
     ) -> ApiKeyPublic:
@@ -110,23 +158,37 @@ class ApiKeyService:
                 key_id = key.key_id
 
             await db.commit()
+            self.invalidate(user_id)
 
             # Return the public view
             cursor = await db.execute(
-                "SELECT * FROM api_keys WHERE key_id = ?", (key_id,)
+                f"SELECT {_PUBLIC_COLUMNS} FROM api_keys WHERE key_id = ?", (key_id,)
             )
             row = await cursor.fetchone()
             return self._row_to_public(row)
 
     async def list_keys(self, user_id: str) -> list[ApiKeyPublic]:
         """List all API keys for a user (without actual key values)."""
+        now = datetime.utcnow()
+        entry = self._list_cache.get(user_id)
+        if entry is not None and entry.expires_at > now:
+            return list(entry.keys)
+
+        generation = self._generations.get(user_id, 0)
         async with get_db() as db:
             cursor = await db.execute(
-                "SELECT * FROM api_keys WHERE user_id = ? ORDER BY provider",
+                f"SELECT {_PUBLIC_COLUMNS} FROM api_keys WHERE user_id = ? ORDER BY provider",
                 (user_id,),
             )
             rows = await cursor.fetchall()
-            return [self._row_to_public(row) for row in rows]
+            keys = [self._row_to_public(row) for row in rows]
+
+        if self._generations.get(user_id, 0) == generation:
+            self._list_cache[user_id] = KeyListCacheEntry(
+                keys=keys,
+                expires_at=now + timedelta(seconds=self.LIST_CACHE_TTL_SECONDS),
+            )
+        return list(keys)
 
     async def get_key(self, user_id: str, provider: str) -> Optional[ApiKey]:
         """Get a full API key (including decrypted value) for a user and provider."""
@@ -148,6 +210,7 @@ class ApiKeyService:
                 (user_id, provider),
             )
             await db.commit()
+            self.invalidate(user_id)
             return cursor.rowcount > 0
 
     async def get_decrypted_keys_for_run(self, user_id: str) -> dict[str, str]:
@@ -156,6 +219,12 @@ class ApiKeyService:
         
         Returns a dict mapping env var names to decrypted key values.
         """
+        now = datetime.utcnow()
+        entry = self._run_env_cache.get(user_id)
+        if entry is not None and entry.expires_at > now:
+            return dict(entry.env_vars)
+
+        generation = self._generations.get(user_id, 0)
         async with get_db() as db:
             cursor = await db.execute(
                 "SELECT provider, encrypted_key, custom_env_var FROM api_keys WHERE user_id = ?",
@@ -163,6 +232,7 @@ class ApiKeyService:
             )
             rows = await cursor.fetchall()
             
+            fernet = _get_fernet()
             env_vars = {}
             for row in rows:
                 provider = row["provider"]
@@ -171,12 +241,17 @@ class ApiKeyService:
                 env_var_name = get_env_var_for_provider(provider, custom_env_var)
                 
                 try:
-                    decrypted = decrypt_api_key(row["encrypted_key"])
-                    env_vars[env_var_name] = decrypted
+                    decrypted = fernet.decrypt(row["encrypted_key"].encode())
+                    env_vars[env_var_name] = decrypted.decode()
                 except Exception:
                     pass  # Skip keys that fail to decrypt
-            
-            return env_vars
+
+        if self._generations.get(user_id, 0) == generation:
+            self._run_env_cache[user_id] = RunEnvCacheEntry(
+                env_vars=env_vars,
+                expires_at=now + timedelta(seconds=self.RUN_ENV_CACHE_TTL_SECONDS),
+            )
+        return dict(env_vars)
 
     def _row_to_key(self, row) -> ApiKey:
         """Convert a database row to an ApiKey model."""
@@ -2,10 +2,11 @@
 Authentication service for user management and JWT handling.
 """
 
+import asyncio
 from datetime import datetime, timedelta
 from typing import Optional
 
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
 from passlib.context import CryptContext
 
 from app.core.config import ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES, SECRET_KEY
@@ -16,6 +17,9 @@ from app.db.session import get_db
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Signing key, constructed once instead of on every encode/decode
+_jwt_key = jwk.construct(SECRET_KEY, ALGORITHM)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
@@ -32,18 +36,18 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     to_encode = data.copy()
     expire = datetime.utcnow() + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
     to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return jwt.encode(to_encode, _jwt_key, algorithm=ALGORITHM)
 
 
 def decode_access_token(token: str) -> Optional[TokenData]:
     """Decode and validate a JWT access token."""
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, _jwt_key, algorithms=[ALGORITHM])
         user_id: str = payload.get("sub")
         email: str = payload.get("email")
         if user_id is None or email is None:
             return None
-        return TokenData(user_id=user_id, email=email)
+        return TokenData(user_id=user_id, email=email, exp=payload.get("exp"))
     except JWTError:
         return None
 
@@ -62,10 +66,12 @@ class AuthService:
             if await cursor.fetchone():
                 return None
             
-            # Create user
+            # Create user (bcrypt is CPU-bound, so hash off the event loop)
+            loop = asyncio.get_event_loop()
+            hashed = await loop.run_in_executor(None, hash_password, user_create.password)
             user = User(
                 email=user_create.email,
-                hashed_password=hash_password(user_create.password),
+                hashed_password=hashed,
             )
             
             await db.execute(
@@ -89,7 +95,10 @@ class AuthService:
         user = await self.get_user_by_email(email)
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        loop = asyncio.get_event_loop()
+        if not await loop.run_in_executor(
+            None, verify_password, password, user.hashed_password
+        ):
             return None
         return user
 
@@ -211,6 +211,8 @@ class BenchmarkCatalog:
         self._cache: Optional[CacheEntry] = None
         self._details_cache: dict[str, Benchmark] = {}
         self._github_cache: Optional[CacheEntry] = None
+        # Discovery currently running; concurrent cache misses await it
+        self._refresh_task: Optional["asyncio.Task[list[Benchmark]]"] = None
         
     def _is_bench_available(self) -> bool:
         """Check if the 'bench' CLI is available."""
@@ -701,6 +703,7 @@ class BenchmarkCatalog:
         4. Static featured list (fallback)
         
         Merges all sources, with featured benchmarks always appearing first.
+        Concurrent callers that miss the cache share a single discovery.
         """
         now = time.time()
         
@@ -708,6 +711,23 @@ class BenchmarkCatalog:
         if not force_refresh and self._cache and self._cache.expires_at > now:
             return self._cache.data
         
+        # Run a single discovery no matter how many requests miss the cache
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.ensure_future(self._run_refresh(force_refresh))
+        # Shield so one cancelled caller does not cancel the shared discovery
+        return await asyncio.shield(self._refresh_task)
+    
+    async def _run_refresh(self, force_refresh: bool) -> list[Benchmark]:
+        """Run discovery and clear the in-flight marker when it finishes."""
+        try:
+            return await self._refresh_benchmarks(force_refresh)
+        finally:
+            self._refresh_task = None
+    
+    async def _refresh_benchmarks(self, force_refresh: bool) -> list[Benchmark]:
+        """Discover benchmarks from every source and repopulate the caches."""
+        now = time.time()
+        
         # Always start with featured benchmarks
         featured = self._get_featured_benchmarks()
         featured_names = {b.name for b in featured}
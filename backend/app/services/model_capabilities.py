@@ -10,6 +10,7 @@ Sources:
 3. Future: Provider API metadata parsing
 """
 
+from functools import lru_cache
 from typing import Dict, Optional, TYPE_CHECKING
 
 from pydantic import BaseModel
@@ -442,11 +443,13 @@ KNOWN_CAPABILITIES: Dict[str, Dict] = {
 }
 
 
+@lru_cache(maxsize=4096)
 def get_model_capabilities(model_id: str) -> tuple[ModelCapabilities, Optional[int]]:
     """
     Get capabilities and context length for a model.
     
     Checks static mapping first, then applies heuristics for unknown models.
+    The result depends only on the model ID, so lookups are memoized.
     
     Args:
         model_id: Full model identifier (e.g., "openai/gpt-4o")
@@ -30,6 +30,7 @@ from app.core.retry import (
 )
 from app.db.models import ApiKeyProvider
 from app.services.api_keys import api_key_service
+from app.services.model_capabilities import enrich_model_with_capabilities
 
 logger = logging.getLogger(__name__)
 
@@ -84,6 +85,8 @@ class CacheEntry:
     """Cached models with expiration."""
     providers: List[ModelProvider]
     expires_at: datetime
+    # Copy of providers with capability metadata, built on first request
+    enriched_providers: Optional[List[ModelProvider]] = None
 
 
 class ModelDiscoveryService:
@@ -172,17 +175,42 @@ class ModelDiscoveryService:
     def __init__(self):
         self._cache: Dict[str, CacheEntry] = {}
     
-    async def get_available_models(self, user_id: str, force_refresh: bool = False) -> List[ModelProvider]:
+    async def get_available_models(
+        self,
+        user_id: str,
+        force_refresh: bool = False,
+        include_capabilities: bool = False,
+    ) -> List[ModelProvider]:
         """
         Get available models for a user based on their API keys.
         
         Args:
             user_id: The user's ID
             force_refresh: If True, bypass cache and fetch fresh data
+            include_capabilities: If True, return models enriched with
+                capability metadata. Enrichment runs once per cache entry.
             
         Returns:
             List of ModelProvider objects with available models
         """
+        entry = await self._get_cache_entry(user_id, force_refresh)
+        if not include_capabilities:
+            return entry.providers
+        
+        if entry.enriched_providers is None:
+            entry.enriched_providers = [
+                provider.model_copy(update={
+                    "models": [
+                        enrich_model_with_capabilities(model.model_copy())
+                        for model in provider.models
+                    ]
+                })
+                for provider in entry.providers
+            ]
+        return entry.enriched_providers
+    
+    async def _get_cache_entry(self, user_id: str, force_refresh: bool) -> CacheEntry:
+        """Get the user's cached providers, fetching them if missing or expired."""
         # Check cache
         now = datetime.utcnow()
         cache_key = f"models:{user_id}"
@@ -190,22 +218,25 @@ class ModelDiscoveryService:
         if not force_refresh and cache_key in self._cache:
             entry = self._cache[cache_key]
             if entry.expires_at > now:
-                return entry.providers
+                return entry
         
         # Get user's API keys
         api_keys = await api_key_service.list_keys(user_id)
         
         if not api_keys:
-            # No API keys, return only custom option
-            return [
-                ModelProvider(
-                    name="Custom",
-                    provider_key="custom",
-                    models=[
-                        ModelInfo(id="custom", name="Custom Model", description="Enter custom model identifier")
-                    ]
-                )
-            ]
+            # No API keys, return only custom option (not cached)
+            return CacheEntry(
+                providers=[
+                    ModelProvider(
+                        name="Custom",
+                        provider_key="custom",
+                        models=[
+                            ModelInfo(id="custom", name="Custom Model", description="Enter custom model identifier")
+                        ]
+                    )
+                ],
+                expires_at=now,
+            )
         
         # Fetch models from each provider in parallel
         tasks = []
@@ -238,12 +269,13 @@ class ModelDiscoveryService:
         )
         
         # Cache the results
-        self._cache[cache_key] = CacheEntry(
+        entry = CacheEntry(
             providers=providers,
             expires_at=now + timedelta(seconds=self.CACHE_TTL_SECONDS)
         )
+        self._cache[cache_key] = entry
         
-        return providers
+        return entry
     
     async def _fetch_provider_models(self, user_id: str, provider: ApiKeyProvider) -> Optional[ModelProvider]:
         """
@@ -10,9 +10,12 @@ Handles:
 import asyncio
 import json
 import logging
+import random
+import time
 import uuid
 from datetime import datetime
 from typing import Optional
+from urllib.parse import urlsplit
 
 import httpx
 
@@ -20,15 +23,104 @@ from app.db.session import get_db
 
 logger = logging.getLogger(__name__)
 
-# Retry configuration
+# Retry configuration (decorrelated jitter backoff between RETRY_BASE_DELAY
+# and RETRY_MAX_DELAY, so retries to one host do not fire in lockstep)
 MAX_RETRIES = 3
-RETRY_DELAYS = [1.0, 2.0, 4.0]  # Exponential backoff: 1s, 2s, 4s
+RETRY_BASE_DELAY = 1.0  # seconds
+RETRY_MAX_DELAY = 4.0  # seconds
 WEBHOOK_TIMEOUT = 10.0  # seconds
 
+# Circuit breaker: after this many consecutive failed attempts by a user to
+# a host, that user's deliveries to it fail fast until CIRCUIT_RESET_SECONDS
+# pass without a new failure. Only signs of an unhealthy host count as
+# failures (connection errors, timeouts, 5xx); a 4xx means the host answered.
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_SECONDS = 60.0
+
+# Connection pool shared by all webhook deliveries
+WEBHOOK_MAX_CONNECTIONS = 200
+WEBHOOK_MAX_KEEPALIVE_CONNECTIONS = 100
+
+# Background workers delivering queued run notifications, and how long
+# shutdown waits for them to finish what is queued
+NOTIFICATION_WORKERS = 4
+NOTIFICATION_DRAIN_TIMEOUT = 15.0  # seconds
+
 
 class NotificationService:
     """Service for managing and sending webhook notifications."""
 
+    def __init__(self):
+        # Created on first delivery so connections to webhook hosts are kept
+        # alive and reused across deliveries; closed on app shutdown
+        self._client: Optional[httpx.AsyncClient] = None
+        # Run notifications waiting for delivery, and the workers sending them.
+        # Both belong to the event loop they were created on.
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: list[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Consecutive failed attempts and time of the last failure, by
+        # (user_id, host), so one user's broken webhook never blocks another's
+        self._host_failures: dict[tuple[str, str], tuple[int, float]] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=WEBHOOK_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=WEBHOOK_MAX_CONNECTIONS,
+                    max_keepalive_connections=WEBHOOK_MAX_KEEPALIVE_CONNECTIONS,
+                ),
+            )
+        return self._client
+
+    def _circuit_open(self, key: tuple[str, str]) -> bool:
+        """Check whether recent failures mean deliveries for a (user_id, host) should fail fast."""
+        failures, last_failure = self._host_failures.get(key, (0, 0.0))
+        return (
+            failures >= CIRCUIT_FAILURE_THRESHOLD
+            and time.monotonic() - last_failure < CIRCUIT_RESET_SECONDS
+        )
+
+    def _record_attempt(self, key: tuple[str, str], host_failed: bool) -> None:
+        """Update a (user_id, host) failure count after a delivery attempt."""
+        if not host_failed:
+            self._host_failures.pop(key, None)
+        else:
+            failures, _ = self._host_failures.get(key, (0, 0.0))
+            self._host_failures[key] = (failures + 1, time.monotonic())
+
+    async def close(self) -> None:
+        """
+        Stop the delivery workers and close the shared HTTP client.
+        
+        Queued run notifications get up to NOTIFICATION_DRAIN_TIMEOUT seconds
+        to be delivered; any still pending after that are logged as dropped.
+        """
+        queue = self._queue
+        if queue is not None and self._loop is asyncio.get_running_loop():
+            try:
+                await asyncio.wait_for(queue.join(), timeout=NOTIFICATION_DRAIN_TIMEOUT)
+            except asyncio.TimeoutError:
+                while not queue.empty():
+                    notification = queue.get_nowait()
+                    queue.task_done()
+                    logger.warning(
+                        f"Run {notification['run_id']}: Webhook notification dropped on shutdown"
+                    )
+        
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        self._loop = None
+        
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     # =========================================================================
     # Settings Management
     # =========================================================================
@@ -41,7 +133,10 @@ class NotificationService:
         """
         async with get_db() as db:
             cursor = await db.execute(
-                "SELECT * FROM notification_settings WHERE user_id = ?",
+                """
+                SELECT webhook_url, webhook_enabled, notify_on_complete, notify_on_failure
+                FROM notification_settings WHERE user_id = ?
+                """,
                 (user_id,),
             )
             row = await cursor.fetchone()
@@ -147,16 +242,22 @@ class NotificationService:
         payload: dict,
         event_type: str,
         run_id: Optional[str] = None,
+        probe_open_circuit: bool = False,
     ) -> tuple[bool, Optional[int], Optional[str]]:
         """
         Send a webhook notification with retry logic.
         
+        If the user's circuit for the URL's host is open, the delivery fails
+        without a request, or with probe_open_circuit makes one attempt and no
+        retries.
+        
         Args:
             user_id: User ID for logging
             webhook_url: URL to POST to
             payload: JSON payload to send
             event_type: Type of event (run_completed, run_failed, test)
             run_id: Optional run ID for logging
+            probe_open_circuit: Try once even if the host's circuit is open
             
         Returns:
             Tuple of (success, status_code, error_message)
@@ -165,77 +266,103 @@ class NotificationService:
         last_status_code = None
         attempt_count = 0
         
-        async with httpx.AsyncClient(timeout=WEBHOOK_TIMEOUT) as client:
-            for attempt in range(MAX_RETRIES):
-                attempt_count = attempt + 1
-                try:
+        host = urlsplit(webhook_url).hostname or webhook_url
+        circuit_key = (user_id, host)
+        max_attempts = MAX_RETRIES
+        if self._circuit_open(circuit_key):
+            if not probe_open_circuit:
+                last_error = f"Circuit open: recent deliveries to {host} failed"
+                logger.warning(f"Webhook delivery skipped: {last_error}")
+                await self._log_webhook(
+                    user_id=user_id,
+                    run_id=run_id,
+                    event_type=event_type,
+                    webhook_url=webhook_url,
+                    status="failed",
+                    error_message=last_error,
+                    attempt_count=0,
+                    payload=payload,
+                )
+                return False, None, last_error
+            max_attempts = 1
+        
+        client = self._get_client()
+        delay = RETRY_BASE_DELAY
+        for attempt in range(max_attempts):
+            attempt_count = attempt + 1
+            try:
+                logger.info(
+                    f"Webhook delivery attempt {attempt_count}/{max_attempts} "
+                    f"to {webhook_url} for {event_type}"
+                )
+                
+                response = await client.post(
+                    webhook_url,
+                    json=payload,
+                    headers={
+                        "Content-Type": "application/json",
+                        "User-Agent": "OpenBench-Studio/1.0",
+                        "X-OpenBench-Event": event_type,
+                    },
+                )
+                
+                last_status_code = response.status_code
+                self._record_attempt(circuit_key, response.is_server_error)
+                
+                if response.is_success:
                     logger.info(
-                        f"Webhook delivery attempt {attempt_count}/{MAX_RETRIES} "
-                        f"to {webhook_url} for {event_type}"
+                        f"Webhook delivered successfully to {webhook_url} "
+                        f"(status: {response.status_code})"
                     )
-                    
-                    response = await client.post(
-                        webhook_url,
-                        json=payload,
-                        headers={
-                            "Content-Type": "application/json",
-                            "User-Agent": "OpenBench-Studio/1.0",
-                            "X-OpenBench-Event": event_type,
-                        },
-                    )
-                    
-                    last_status_code = response.status_code
-                    
-                    if response.is_success:
-                        logger.info(
-                            f"Webhook delivered successfully to {webhook_url} "
-                            f"(status: {response.status_code})"
-                        )
-                        # Log success
-                        await self._log_webhook(
-                            user_id=user_id,
-                            run_id=run_id,
-                            event_type=event_type,
-                            webhook_url=webhook_url,
-                            status="success",
-                            status_code=response.status_code,
-                            attempt_count=attempt_count,
-                            payload=payload,
-                        )
-                        return True, response.status_code, None
-                    
-                    # Non-success status code
-                    last_error = f"HTTP {response.status_code}: {response.text[:200]}"
-                    logger.warning(
-                        f"Webhook delivery failed (attempt {attempt_count}): {last_error}"
-                    )
-                    
-                except httpx.TimeoutException:
-                    last_error = "Request timed out"
-                    logger.warning(
-                        f"Webhook delivery timeout (attempt {attempt_count})"
-                    )
-                except httpx.ConnectError as e:
-                    last_error = f"Connection failed: {str(e)}"
-                    logger.warning(
-                        f"Webhook connection failed (attempt {attempt_count}): {e}"
-                    )
-                except Exception as e:
-                    last_error = f"Unexpected error: {str(e)}"
-                    logger.error(
-                        f"Webhook delivery error (attempt {attempt_count}): {e}",
-                        exc_info=True,
+                    # Log success
+                    await self._log_webhook(
+                        user_id=user_id,
+                        run_id=run_id,
+                        event_type=event_type,
+                        webhook_url=webhook_url,
+                        status="success",
+                        status_code=response.status_code,
+                        attempt_count=attempt_count,
+                        payload=payload,
                     )
+                    return True, response.status_code, None
                 
-                # Wait before retry (except on last attempt)
-                if attempt < MAX_RETRIES - 1:
-                    delay = RETRY_DELAYS[attempt]
-                    logger.info(f"Retrying webhook in {delay}s...")
-                    await asyncio.sleep(delay)
-        
+                # Non-success status code
+                last_error = f"HTTP {response.status_code}: {response.text[:200]}"
+                logger.warning(
+                    f"Webhook delivery failed (attempt {attempt_count}): {last_error}"
+                )
+                
+            except httpx.TimeoutException:
+                self._record_attempt(circuit_key, True)
+                last_error = "Request timed out"
+                logger.warning(
+                    f"Webhook delivery timeout (attempt {attempt_count})"
+                )
+            except httpx.ConnectError as e:
+                self._record_attempt(circuit_key, True)
+                last_error = f"Connection failed: {str(e)}"
+                logger.warning(
+                    f"Webhook connection failed (attempt {attempt_count}): {e}"
+                )
+            except Exception as e:
+                last_error = f"Unexpected error: {str(e)}"
+                logger.error(
+                    f"Webhook delivery error (attempt {attempt_count}): {e}",
+                    exc_info=True,
+                )
+            
+            # Wait before retry (except on last attempt or once the circuit opens)
+            if attempt < max_attempts - 1:
+                if self._circuit_open(circuit_key):
+                    break
+                delay = min(RETRY_MAX_DELAY, random.uniform(RETRY_BASE_DELAY, delay * 3))
+                logger.info(f"Retrying webhook in {delay:.1f}s...")
+                await asyncio.sleep(delay)
+    
         # All retries failed
         logger.error(
-            f"Webhook delivery failed after {MAX_RETRIES} attempts to {webhook_url}"
+            f"Webhook delivery failed after {attempt_count} attempts to {webhook_url}"
         )
         
         # Log failure
@@ -325,6 +452,61 @@ class NotificationService:
         
         return success
 
+    def queue_run_notification(
+        self,
+        user_id: str,
+        run_id: str,
+        benchmark: str,
+        model: str,
+        status: str,
+        score: Optional[float] = None,
+        duration_seconds: Optional[int] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """
+        Queue a run notification for background delivery.
+        
+        Takes the same arguments as send_run_notification. Delivery (with its
+        retries and backoff) runs on a worker, so finishing a run never waits
+        on a slow or failing webhook endpoint.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._workers = [
+                asyncio.create_task(self._delivery_worker(self._queue))
+                for _ in range(NOTIFICATION_WORKERS)
+            ]
+        self._queue.put_nowait({
+            "user_id": user_id,
+            "run_id": run_id,
+            "benchmark": benchmark,
+            "model": model,
+            "status": status,
+            "score": score,
+            "duration_seconds": duration_seconds,
+            "error": error,
+        })
+
+    async def _delivery_worker(self, queue: asyncio.Queue) -> None:
+        """Deliver queued run notifications until cancelled."""
+        while True:
+            notification = await queue.get()
+            try:
+                await self.send_run_notification(**notification)
+            except asyncio.CancelledError:
+                logger.warning(
+                    f"Run {notification['run_id']}: Webhook notification dropped on shutdown"
+                )
+                raise
+            except Exception as e:
+                logger.warning(
+                    f"Run {notification['run_id']}: Webhook notification failed: {e}"
+                )
+            finally:
+                queue.task_done()
+
     async def test_webhook(
         self,
         user_id: str,
@@ -333,6 +515,9 @@ class NotificationService:
         """
         Send a test webhook to verify the URL is working.
         
+        A test always reaches the endpoint: if the host's circuit is open it
+        is tried once instead of being skipped.
+        
         Returns (success, status_code, error_message).
         """
         payload = {
@@ -346,6 +531,7 @@ class NotificationService:
             webhook_url=webhook_url,
             payload=payload,
             event_type="test",
+            probe_open_circuit=True,
         )
 
     # =========================================================================
@@ -399,20 +585,53 @@ class NotificationService:
         self,
         user_id: str,
         limit: int = 50,
+        cursor: Optional[str] = None,
+        event_type: Optional[str] = None,
+        status: Optional[str] = None,
         offset: int = 0,
-    ) -> list[dict]:
-        """Get recent webhook logs for a user."""
+    ) -> Optional[list[dict]]:
+        """
+        Get recent webhook logs for a user, newest first.
+        
+        Pages are keyset-paginated: pass the log_id of the last entry of the
+        previous page as ``cursor`` to get the entries logged before it.
+        Returns None if the cursor is not one of the user's logs. ``offset``
+        (skip that many entries) is still supported for older clients.
+        ``event_type`` and ``status`` optionally narrow the logs returned.
+        """
+        conditions = ["user_id = ?"]
+        params: list = [user_id]
+        
+        if event_type:
+            conditions.append("event_type = ?")
+            params.append(event_type)
+        
+        if status:
+            conditions.append("status = ?")
+            params.append(status)
+        
         async with get_db() as db:
-            cursor = await db.execute(
-                """
-                SELECT * FROM webhook_logs 
-                WHERE user_id = ? 
-                ORDER BY created_at DESC 
-                LIMIT ? OFFSET ?
-                """,
-                (user_id, limit, offset),
+            # Continue after the previous page's last entry
+            if cursor is not None:
+                result = await db.execute(
+                    "SELECT created_at FROM webhook_logs WHERE log_id = ? AND user_id = ?",
+                    (cursor, user_id),
+                )
+                row = await result.fetchone()
+                if row is None:
+                    return None
+                conditions.append("(created_at, log_id) < (?, ?)")
+                params.extend([row["created_at"], cursor])
+            
+            where_clause = " AND ".join(conditions)
+            query = (
+                f"SELECT * FROM webhook_logs WHERE {where_clause} "
+                "ORDER BY created_at DESC, log_id DESC LIMIT ? OFFSET ?"
             )
-            rows = await cursor.fetchall()
+            params.extend([limit, offset])
+            
+            result = await db.execute(query, params)
+            rows = await result.fetchall()
             
             return [
                 {
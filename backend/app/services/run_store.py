@@ -1,6 +1,7 @@
 import json
 import shutil
 from datetime import datetime
+from enum import Enum
 from pathlib import Path
 from typing import Optional
 
@@ -8,6 +9,16 @@ from app.core.config import RUNS_DIR
 from app.db.session import get_db
 from app.db.models import Run, RunConfig, RunCreate, RunStatus, RunSummary
 
+# IDs per statement for bulk operations, well under SQLite's bound-parameter limit
+BULK_BATCH_SIZE = 500
+
+
+class DeleteResult(str, Enum):
+    """Outcome of deleting a single run."""
+    DELETED = "deleted"
+    NOT_FOUND = "not_found"
+    RUNNING = "running"
+
 
 class RunStore:
     """Service for storing and retrieving runs from SQLite."""
@@ -315,34 +326,105 @@ class RunStore:
             user_id: If provided, only deletes if user owns the run
             
         Returns:
-            True if run was deleted, False if not found or not authorized
+            True if run was deleted, False if not found, not authorized or running
         """
-        # First check the run exists and user has access
-        run = await self.get_run(run_id, user_id=user_id)
-        if run is None:
-            return False
+        return await self.try_delete(run_id, user_id=user_id) == DeleteResult.DELETED
+
+    async def try_delete(self, run_id: str, user_id: Optional[str] = None) -> DeleteResult:
+        """
+        Delete a run and its artifacts, reporting why nothing was deleted.
         
-        # Don't delete running runs
-        if run.status == RunStatus.RUNNING:
-            return False
+        The ownership and status checks are part of the DELETE itself, so a
+        successful delete takes one statement. Only when no row was deleted
+        is the run looked up, to tell a running run from a missing one.
+        
+        Args:
+            run_id: The run ID to delete
+            user_id: If provided, only deletes if user owns the run
+        """
+        owner_clause = ""
+        params: list = [run_id]
+        if user_id is not None:
+            owner_clause = " AND (user_id = ? OR user_id IS NULL)"
+            params.append(user_id)
         
-        # Delete from database
         async with get_db() as db:
-            if user_id is not None:
-                await db.execute(
-                    "DELETE FROM runs WHERE run_id = ? AND (user_id = ? OR user_id IS NULL)",
-                    (run_id, user_id),
-                )
-            else:
-                await db.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
+            cursor = await db.execute(
+                f"DELETE FROM runs WHERE run_id = ?{owner_clause} AND status != ?",
+                (*params, RunStatus.RUNNING.value),
+            )
             await db.commit()
+            if cursor.rowcount == 0:
+                cursor = await db.execute(
+                    f"SELECT 1 FROM runs WHERE run_id = ?{owner_clause}", params
+                )
+                if await cursor.fetchone() is None:
+                    return DeleteResult.NOT_FOUND
+                return DeleteResult.RUNNING
         
         # Delete artifact directory if it exists
         artifact_path = RUNS_DIR / run_id
         if artifact_path.exists():
             shutil.rmtree(artifact_path, ignore_errors=True)
         
-        return True
+        return DeleteResult.DELETED
+
+    async def get_run_statuses(
+        self, run_ids: list[str], user_id: Optional[str] = None
+    ) -> dict[str, RunStatus]:
+        """
+        Get the status of several runs in one query per batch of IDs.
+        
+        If user_id is provided, only runs that belong to that user (or have no
+        owner) are included. Missing runs are absent from the result.
+        """
+        statuses: dict[str, RunStatus] = {}
+        async with get_db() as db:
+            for start in range(0, len(run_ids), BULK_BATCH_SIZE):
+                batch = run_ids[start:start + BULK_BATCH_SIZE]
+                placeholders = ", ".join("?" * len(batch))
+                query = f"SELECT run_id, status FROM runs WHERE run_id IN ({placeholders})"
+                params: list = list(batch)
+                if user_id is not None:
+                    query += " AND (user_id = ? OR user_id IS NULL)"
+                    params.append(user_id)
+                cursor = await db.execute(query, params)
+                for row in await cursor.fetchall():
+                    statuses[row["run_id"]] = RunStatus(row["status"])
+        return statuses
+
+    async def bulk_delete(self, run_ids: list[str], user_id: Optional[str] = None) -> set[str]:
+        """
+        Delete several runs and their artifacts, skipping running runs.
+        
+        Args:
+            run_ids: The run IDs to delete
+            user_id: If provided, only deletes runs the user owns
+            
+        Returns:
+            The IDs of the runs that were deleted
+        """
+        deleted: set[str] = set()
+        async with get_db() as db:
+            for start in range(0, len(run_ids), BULK_BATCH_SIZE):
+                batch = run_ids[start:start + BULK_BATCH_SIZE]
+                placeholders = ", ".join("?" * len(batch))
+                query = f"DELETE FROM runs WHERE run_id IN ({placeholders}) AND status != ?"
+                params: list = [*batch, RunStatus.RUNNING.value]
+                if user_id is not None:
+                    query += " AND (user_id = ? OR user_id IS NULL)"
+                    params.append(user_id)
+                cursor = await db.execute(query + " RETURNING run_id", params)
+                deleted.update(row["run_id"] for row in await cursor.fetchall())
+            await db.commit()
+        
+        # Delete artifact directories of the deleted runs
+        for run_id in deleted:
+            artifact_path = RUNS_DIR / run_id
+            if artifact_path.exists():
+                shutil.rmtree(artifact_path, ignore_errors=True)
+        
+        return deleted
 
     async def update_tags(self, run_id: str, tags: list[str], user_id: Optional[str] = None) -> Optional[Run]:
         """
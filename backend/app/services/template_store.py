@@ -136,19 +136,13 @@ class TemplateStore:
         user_id: str,
     ) -> bool:
         """Delete a template."""
-        # Check template exists
-        template = await self.get_template(template_id, user_id)
-        if template is None:
-            return False
-        
         async with get_db() as db:
-            await db.execute(
+            cursor = await db.execute(
                 "DELETE FROM run_templates WHERE template_id = ? AND user_id = ?",
                 (template_id, user_id),
             )
             await db.commit()
-        
-        return True
+            return cursor.rowcount > 0
 
     def _row_to_template(self, row) -> RunTemplate:
         """Convert a database row to a RunTemplate model."""
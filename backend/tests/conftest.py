@@ -117,19 +117,36 @@ async def _init_test_db(db_path: Path):
         # Notification settings table
         await db.execute("""
             CREATE TABLE IF NOT EXISTS notification_settings (
-                user_id TEXT PRIMARY KEY,
-                email_enabled INTEGER DEFAULT 0,
-                email_address TEXT,
-                webhook_enabled INTEGER DEFAULT 0,
+                settings_id TEXT PRIMARY KEY,
+                user_id TEXT NOT NULL UNIQUE,
                 webhook_url TEXT,
-                notify_on_complete INTEGER DEFAULT 1,
-                notify_on_fail INTEGER DEFAULT 1,
+                webhook_enabled INTEGER NOT NULL DEFAULT 0,
+                notify_on_complete INTEGER NOT NULL DEFAULT 1,
+                notify_on_failure INTEGER NOT NULL DEFAULT 1,
                 created_at TEXT NOT NULL,
                 updated_at TEXT NOT NULL,
                 FOREIGN KEY (user_id) REFERENCES users(user_id)
             )
         """)
         
+        # Webhook delivery logs table
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS webhook_logs (
+                log_id TEXT PRIMARY KEY,
+                user_id TEXT NOT NULL,
+                run_id TEXT,
+                event_type TEXT NOT NULL,
+                webhook_url TEXT NOT NULL,
+                status TEXT NOT NULL,
+                status_code INTEGER,
+                error_message TEXT,
+                attempt_count INTEGER NOT NULL DEFAULT 1,
+                payload_json TEXT,
+                created_at TEXT NOT NULL,
+                FOREIGN KEY (user_id) REFERENCES users(user_id)
+            )
+        """)
+        
         await db.commit()
 
 
@@ -164,12 +181,14 @@ async def test_db(temp_db_path: Path, monkeypatch) -> AsyncGenerator[aiosqlite.C
     import app.db.session
     import app.services.auth
     import app.services.api_keys
+    import app.services.notifications
     import app.services.run_store
     import app.services.template_store
     
     monkeypatch.setattr(app.db.session, "get_db", test_get_db)
     monkeypatch.setattr(app.services.auth, "get_db", test_get_db)
     monkeypatch.setattr(app.services.api_keys, "get_db", test_get_db)
+    monkeypatch.setattr(app.services.notifications, "get_db", test_get_db)
     monkeypatch.setattr(app.services.run_store, "get_db", test_get_db)
     monkeypatch.setattr(app.services.template_store, "get_db", test_get_db)
     
@@ -9,6 +9,7 @@ Tests cover:
 """
 
 import os
+from contextlib import asynccontextmanager
 
 import pytest
 
@@ -222,6 +223,24 @@ class TestApiKeyService:
         assert "openai" in providers
         assert "anthropic" in providers
 
+    @pytest.mark.asyncio
+    async def test_list_keys_reflects_writes(self, test_db):
+        """Should not serve a cached list after a key is added or deleted."""
+        service = ApiKeyService()
+        user_id = "user-123"
+
+        assert await service.list_keys(user_id) == []
+
+        await service.create_or_update_key(
+            user_id,
+            ApiKeyCreate(provider="openai", key="sk-open123")
+        )
+        keys = await service.list_keys(user_id)
+        assert [k.provider for k in keys] == ["openai"]
+
+        await service.delete_key(user_id, "openai")
+        assert await service.list_keys(user_id) == []
+
     @pytest.mark.asyncio
     async def test_get_key_decrypted(self, test_db, sample_api_key_data):
         """Should retrieve and decrypt a key."""
@@ -290,6 +309,58 @@ class TestApiKeyService:
         assert "ANTHROPIC_API_KEY" in env_vars
         assert env_vars["ANTHROPIC_API_KEY"] == "sk-anthropic-key"
 
+    @pytest.mark.asyncio
+    async def test_decrypted_keys_reflect_updates(self, test_db):
+        """Cached run env vars should be dropped when a key changes."""
+        service = ApiKeyService()
+        user_id = "user-123"
+
+        await service.create_or_update_key(
+            user_id,
+            ApiKeyCreate(provider="openai", key="sk-old-key")
+        )
+        first = await service.get_decrypted_keys_for_run(user_id)
+        first["OPENAI_API_KEY"] = "mutated"
+
+        assert (await service.get_decrypted_keys_for_run(user_id))["OPENAI_API_KEY"] == "sk-old-key"
+
+        await service.create_or_update_key(
+            user_id,
+            ApiKeyCreate(provider="openai", key="sk-new-key")
+        )
+        assert (await service.get_decrypted_keys_for_run(user_id))["OPENAI_API_KEY"] == "sk-new-key"
+
+        await service.delete_key(user_id, "openai")
+        assert await service.get_decrypted_keys_for_run(user_id) == {}
+
+    @pytest.mark.asyncio
+    async def test_fill_racing_invalidation_not_cached(self, test_db, monkeypatch):
+        """A cache fill that overlaps a key change should not be stored."""
+        import app.services.api_keys as api_keys_module
+
+        service = ApiKeyService()
+        user_id = "user-123"
+        await service.create_or_update_key(
+            user_id,
+            ApiKeyCreate(provider="openai", key="sk-old-key")
+        )
+
+        # Simulate a key change landing while the fill reads the database
+        real_get_db = api_keys_module.get_db
+
+        @asynccontextmanager
+        async def racing_get_db():
+            async with real_get_db() as db:
+                yield db
+            service.invalidate(user_id)
+
+        monkeypatch.setattr(api_keys_module, "get_db", racing_get_db)
+        await service.get_decrypted_keys_for_run(user_id)
+        await service.list_keys(user_id)
+
+        assert user_id not in service._run_env_cache
+        assert user_id not in service._list_cache
+
     @pytest.mark.asyncio
     async def test_custom_env_var_in_run(self, test_db):
         """Should use custom env var name in run environment."""
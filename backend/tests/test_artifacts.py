@@ -0,0 +1,85 @@
+"""
+Tests for run artifact helpers.
+
+Tests cover:
+- Reading log tails, compared against reading the whole file
+"""
+
+import os
+import random
+
+import pytest
+
+# Set test environment before imports
+os.environ["OPENBENCH_SECRET_KEY"] = "test-secret-key-for-testing-only-32"
+os.environ["OPENBENCH_ENCRYPTION_KEY"] = "test-encryption-key-32-chars-xxx"
+
+import app.runner.artifacts as artifacts
+from app.runner.artifacts import read_log_tail
+
+RUN_ID = "run-1"
+
+LINE_COUNTS = [0, 1, 2, 5, 100, -3]
+
+
+def read_whole_log_tail(path, lines: int) -> str:
+    """Reference implementation: read every line and keep the last N."""
+    with open(path, encoding="utf-8") as f:
+        return "".join(f.readlines()[-lines:])
+
+
+def random_log(rng: random.Random, newline: str) -> str:
+    """Build a log of random lines, sometimes without a final newline."""
+    words = ["loss", "step", "é", "ok", "", "   ", "résultat", "x" * 50]
+    line_count = rng.randint(0, 40)
+    text = newline.join(
+        " ".join(rng.choice(words) for _ in range(rng.randint(0, 6)))
+        for _ in range(line_count)
+    )
+    if line_count and rng.random() < 0.5:
+        text += newline
+    return text
+
+
+@pytest.fixture
+def log_path(tmp_path, monkeypatch):
+    """Point the artifact helpers at a temporary runs directory."""
+    monkeypatch.setattr(artifacts, "RUNS_DIR", tmp_path)
+    (tmp_path / RUN_ID).mkdir()
+    return tmp_path / RUN_ID / "stdout.log"
+
+
+class TestReadLogTail:
+    """read_log_tail must match reading the whole file and slicing its lines."""
+
+    @pytest.mark.parametrize("block_size", [1, 3, 16, 8192])
+    @pytest.mark.parametrize("newline", ["\n", "\r\n", "\r"])
+    def test_matches_whole_file_read(self, log_path, monkeypatch, block_size, newline):
+        """Random logs should give the same tail for every line count."""
+        monkeypatch.setattr(artifacts, "TAIL_BLOCK_SIZE", block_size)
+        rng = random.Random(f"{block_size}-{newline!r}")
+
+        for _ in range(50):
+            log_path.write_bytes(random_log(rng, newline).encode("utf-8"))
+            for lines in LINE_COUNTS:
+                expected = read_whole_log_tail(log_path, lines)
+                assert read_log_tail(RUN_ID, lines=lines) == expected, (block_size, newline, lines)
+
+    @pytest.mark.parametrize("block_size", [1, 3, 16, 8192])
+    def test_mixed_line_endings(self, log_path, monkeypatch, block_size):
+        """Logs mixing LF, CRLF and CR should split lines the same way."""
+        monkeypatch.setattr(artifacts, "TAIL_BLOCK_SIZE", block_size)
+        rng = random.Random(block_size)
+
+        for _ in range(50):
+            text = "".join(
+                rng.choice(["a", "bb", "é", "\n", "\r\n", "\r"]) for _ in range(rng.randint(0, 60))
+            )
+            log_path.write_bytes(text.encode("utf-8"))
+            for lines in LINE_COUNTS:
+                expected = read_whole_log_tail(log_path, lines)
+                assert read_log_tail(RUN_ID, lines=lines) == expected, (block_size, text, lines)
+
+    def test_missing_log(self, log_path):
+        """Should return None when the log does not exist."""
+        assert read_log_tail(RUN_ID) is None
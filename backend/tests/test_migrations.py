@@ -0,0 +1,131 @@
+"""
+Tests for database migrations.
+
+Tests cover:
+- Fresh databases created from the SQLAlchemy models
+- Parity between the models and the full migration chain
+- Downgrading individual migrations
+- Indexes serving the webhook log filters
+"""
+
+import os
+
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import create_engine, inspect
+
+# Set test environment before imports
+os.environ["OPENBENCH_SECRET_KEY"] = "test-secret-key-for-testing-only-32"
+os.environ["OPENBENCH_ENCRYPTION_KEY"] = "test-encryption-key-32-chars-xxx"
+
+import app.core.config as config
+import app.db.migrations as migrations
+from app.db.sa_models import Base
+
+
+@pytest.fixture
+def migration_db(temp_db_path, monkeypatch):
+    """Point the migration helpers and Alembic's env.py at a temporary database."""
+    monkeypatch.setattr(config, "DATABASE_PATH", temp_db_path)
+    monkeypatch.setattr(migrations, "DATABASE_PATH", temp_db_path)
+    return temp_db_path
+
+
+class TestRunMigrations:
+    """Tests for run_migrations()."""
+
+    def test_fresh_database_created_at_head(self, migration_db):
+        """Should create all tables on a fresh database and stamp it at head."""
+        migrations.run_migrations()
+
+        engine = create_engine(f"sqlite:///{migration_db}")
+        tables = set(inspect(engine).get_table_names())
+
+        assert set(Base.metadata.tables) <= tables
+        assert migrations.get_current_revision() == migrations.get_head_revision()
+
+    def test_up_to_date_database_is_noop(self, migration_db):
+        """Should leave an up-to-date database untouched."""
+        migrations.run_migrations()
+        migrations.run_migrations()
+
+        assert migrations.get_current_revision() == migrations.get_head_revision()
+
+
+class TestSchemaParity:
+    """The models must describe exactly what the migration chain builds."""
+
+    def test_migration_chain_matches_models(self, migration_db):
+        """Replaying every migration should produce the models' schema."""
+        command.upgrade(migrations.get_alembic_config(), "head")
+
+        engine = create_engine(f"sqlite:///{migration_db}")
+        with engine.connect() as connection:
+            context = MigrationContext.configure(
+                connection,
+                opts={"compare_type": True, "compare_server_default": True},
+            )
+            diff = compare_metadata(context, Base.metadata)
+
+        assert diff == []
+
+
+class TestDowngrade:
+    """Migrations must undo what they did."""
+
+    def test_notification_settings_unique_round_trip(self, migration_db):
+        """Downgrading below h8i9j0k1l234 should restore the unique index."""
+        alembic_config = migrations.get_alembic_config()
+        command.upgrade(alembic_config, "head")
+        command.downgrade(alembic_config, "g7h8i9j0k123")
+
+        engine = create_engine(f"sqlite:///{migration_db}")
+        inspector = inspect(engine)
+        indexes = {ix["name"]: ix for ix in inspector.get_indexes("notification_settings")}
+        constraints = {uc["name"] for uc in inspector.get_unique_constraints("notification_settings")}
+        engine.dispose()
+
+        assert indexes["ix_notification_settings_user_id"]["unique"]
+        assert "uix_notification_settings_user" not in constraints
+
+        command.upgrade(alembic_config, "head")
+
+        engine = create_engine(f"sqlite:///{migration_db}")
+        inspector = inspect(engine)
+        indexes = {ix["name"] for ix in inspector.get_indexes("notification_settings")}
+        constraints = {uc["name"] for uc in inspector.get_unique_constraints("notification_settings")}
+        engine.dispose()
+
+        assert "ix_notification_settings_user_id" not in indexes
+        assert "uix_notification_settings_user" in constraints
+
+
+class TestWebhookLogIndexes:
+    """Filtered webhook log pages should be index seeks in keyset order."""
+
+    @pytest.mark.parametrize("filters", [
+        ["event_type = ?", "status = ?"],
+        ["status = ?"],
+    ])
+    def test_filtered_page_needs_no_sort(self, migration_db, filters):
+        """Should seek the filtered logs in an index without sorting them."""
+        command.upgrade(migrations.get_alembic_config(), "head")
+
+        where_clause = " AND ".join(["user_id = ?"] + filters)
+        query = (
+            f"EXPLAIN QUERY PLAN SELECT * FROM webhook_logs WHERE {where_clause} "
+            "ORDER BY created_at DESC, log_id DESC LIMIT 50"
+        )
+        engine = create_engine(f"sqlite:///{migration_db}")
+        with engine.connect() as connection:
+            plan = " ".join(
+                row[-1] for row in connection.exec_driver_sql(query, ("user-1",) * (len(filters) + 1))
+            )
+        engine.dispose()
+
+        # The filters are part of the index seek, not applied row by row
+        assert "status=?" in plan
+        assert "TEMP B-TREE" not in plan
+
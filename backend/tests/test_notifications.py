@@ -0,0 +1,414 @@
+"""
+Tests for the webhook notification service.
+
+Tests cover:
+- Circuit breaker opening, half-open probing and per-user isolation
+- Webhook log pagination and filters
+- Queued run notification delivery and shutdown
+"""
+
+import asyncio
+import logging
+import time
+from typing import Optional
+
+import httpx
+import pytest
+
+import app.services.notifications as notifications
+from app.services.notifications import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RESET_SECONDS,
+    MAX_RETRIES,
+    NotificationService,
+)
+
+WEBHOOK_URL = "https://hooks.example.com/webhook"
+
+
+def make_service(handler) -> NotificationService:
+    """Create a service whose HTTP client answers with the given handler."""
+    service = NotificationService()
+    service._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return service
+
+
+class CountingHandler:
+    """Mock transport handler that counts requests and answers with a fixed result."""
+
+    def __init__(self, status_code: int = 200, error: Optional[Exception] = None):
+        self.status_code = status_code
+        self.error = error
+        self.requests = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        if self.error is not None:
+            raise self.error
+        return httpx.Response(self.status_code)
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    """Retry immediately so tests do not sleep."""
+    monkeypatch.setattr(notifications, "RETRY_BASE_DELAY", 0.0)
+    monkeypatch.setattr(notifications, "RETRY_MAX_DELAY", 0.0)
+
+
+async def send(service: NotificationService, user_id: str = "user-1"):
+    """Send a run notification webhook for a user."""
+    return await service.send_webhook(
+        user_id=user_id,
+        webhook_url=WEBHOOK_URL,
+        payload={"event": "run_completed"},
+        event_type="run_completed",
+    )
+
+
+class TestCircuitBreaker:
+    """Tests for the per-user, per-host circuit breaker."""
+
+    @pytest.mark.asyncio
+    async def test_server_errors_open_circuit(self, test_db):
+        """Should stop contacting a host after repeated 5xx responses."""
+        handler = CountingHandler(status_code=503)
+        service = make_service(handler)
+
+        await send(service)
+        await send(service)
+        assert handler.requests == CIRCUIT_FAILURE_THRESHOLD
+
+        success, status_code, error = await send(service)
+
+        assert success is False
+        assert status_code is None
+        assert error.startswith("Circuit open")
+        assert handler.requests == CIRCUIT_FAILURE_THRESHOLD
+        logs = await service.get_webhook_logs("user-1")
+        assert logs[0]["attempt_count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_connect_errors_open_circuit(self, test_db):
+        """Should count connection failures against the host."""
+        handler = CountingHandler(error=httpx.ConnectError("refused"))
+        service = make_service(handler)
+
+        await send(service)
+        await send(service)
+        await send(service)
+
+        assert handler.requests == CIRCUIT_FAILURE_THRESHOLD
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_open_circuit(self, test_db):
+        """A 4xx means the host answered, so it should never trip the breaker."""
+        handler = CountingHandler(status_code=404)
+        service = make_service(handler)
+
+        for _ in range(3):
+            success, status_code, _ = await send(service)
+            assert success is False
+            assert status_code == 404
+
+        assert handler.requests == 3 * MAX_RETRIES
+        assert service._host_failures == {}
+
+    @pytest.mark.asyncio
+    async def test_half_open_probe_after_reset(self, test_db):
+        """Once the reset period passes, one attempt should be let through."""
+        handler = CountingHandler(status_code=500)
+        service = make_service(handler)
+        await send(service)
+        await send(service)
+        key = ("user-1", "hooks.example.com")
+        failures, _ = service._host_failures[key]
+        service._host_failures[key] = (
+            failures, time.monotonic() - CIRCUIT_RESET_SECONDS - 1
+        )
+
+        # The probe fails, so the circuit reopens after a single attempt
+        requests_before = handler.requests
+        success, _, _ = await send(service)
+        assert success is False
+        assert handler.requests == requests_before + 1
+        assert service._circuit_open(key)
+
+        # A successful probe closes it again
+        failures, _ = service._host_failures[key]
+        service._host_failures[key] = (
+            failures, time.monotonic() - CIRCUIT_RESET_SECONDS - 1
+        )
+        handler.status_code = 200
+        success, status_code, _ = await send(service)
+        assert success is True
+        assert status_code == 200
+        assert key not in service._host_failures
+
+    @pytest.mark.asyncio
+    async def test_test_webhook_probes_open_circuit(self, test_db):
+        """A test delivery should try once even while the circuit is open."""
+        handler = CountingHandler(status_code=500)
+        service = make_service(handler)
+        await send(service)
+        await send(service)
+        requests_before = handler.requests
+
+        success, status_code, _ = await service.test_webhook("user-1", WEBHOOK_URL)
+
+        assert success is False
+        assert status_code == 500
+        assert handler.requests == requests_before + 1
+
+    @pytest.mark.asyncio
+    async def test_circuit_isolated_between_users(self, test_db):
+        """One user's failing webhook should not block another user on the same host."""
+        handler = CountingHandler(status_code=500)
+        service = make_service(handler)
+        await send(service, user_id="user-1")
+        await send(service, user_id="user-1")
+        assert service._circuit_open(("user-1", "hooks.example.com"))
+
+        handler.status_code = 200
+        success, status_code, _ = await send(service, user_id="user-2")
+
+        assert success is True
+        assert status_code == 200
+        assert service._circuit_open(("user-1", "hooks.example.com"))
+
+
+async def insert_logs(
+    db,
+    user_id: str,
+    created_ats: list[str],
+    event_types: Optional[list[str]] = None,
+    statuses: Optional[list[str]] = None,
+) -> None:
+    """Insert webhook log rows for a user with the given timestamps."""
+    for i, created_at in enumerate(created_ats):
+        await db.execute(
+            """
+            INSERT INTO webhook_logs
+            (log_id, user_id, event_type, webhook_url, status, attempt_count, created_at)
+            VALUES (?, ?, ?, ?, ?, 1, ?)
+            """,
+            (
+                f"{user_id}-log-{i:02d}",
+                user_id,
+                event_types[i] if event_types else "test",
+                WEBHOOK_URL,
+                statuses[i] if statuses else "success",
+                created_at,
+            ),
+        )
+    await db.commit()
+
+
+class TestWebhookLogPagination:
+    """Tests for paging through webhook logs."""
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages_across_equal_timestamps(self, test_db):
+        """Should return every log exactly once, even when timestamps tie."""
+        await insert_logs(test_db, "user-1", ["2026-01-01T00:00:00"] * 5 + ["2026-01-02T00:00:00"] * 2)
+        service = NotificationService()
+
+        seen = []
+        cursor = None
+        while True:
+            page = await service.get_webhook_logs("user-1", limit=2, cursor=cursor)
+            if not page:
+                break
+            seen.extend(log["log_id"] for log in page)
+            cursor = page[-1]["log_id"]
+
+        expected = [f"user-1-log-{i:02d}" for i in (6, 5, 4, 3, 2, 1, 0)]
+        assert seen == expected
+
+    @pytest.mark.asyncio
+    async def test_unknown_cursor(self, test_db):
+        """Should reject cursors that are not one of the user's logs."""
+        await insert_logs(test_db, "user-1", ["2026-01-01T00:00:00"])
+        await insert_logs(test_db, "user-2", ["2026-01-01T00:00:00"])
+        service = NotificationService()
+
+        assert await service.get_webhook_logs("user-1", cursor="missing") is None
+        assert await service.get_webhook_logs("user-1", cursor="user-2-log-00") is None
+
+    @pytest.mark.asyncio
+    async def test_offset_still_supported(self, test_db):
+        """Should skip the given number of logs for clients still using offset."""
+        await insert_logs(test_db, "user-1", [f"2026-01-0{i}T00:00:00" for i in range(1, 5)])
+        service = NotificationService()
+
+        logs = await service.get_webhook_logs("user-1", limit=2, offset=1)
+
+        assert [log["log_id"] for log in logs] == ["user-1-log-02", "user-1-log-01"]
+
+
+class TestWebhookLogFilters:
+    """Tests for filtering webhook logs by event type and status."""
+
+    EVENT_TYPES = ["run_completed", "run_failed", "run_completed", "test", "run_completed", "run_failed"]
+    STATUSES = ["success", "failed", "failed", "success", "success", "failed"]
+
+    async def insert_mixed_logs(self, db) -> None:
+        """Insert logs with a mix of event types and statuses for two users."""
+        created_ats = [f"2026-01-0{i}T00:00:00" for i in range(1, 7)]
+        await insert_logs(db, "user-1", created_ats, self.EVENT_TYPES, self.STATUSES)
+        await insert_logs(db, "user-2", created_ats, self.EVENT_TYPES, self.STATUSES)
+
+    @pytest.mark.asyncio
+    async def test_filter_by_event_type(self, test_db):
+        """Should only return the user's logs of the given event type."""
+        await self.insert_mixed_logs(test_db)
+        service = NotificationService()
+
+        logs = await service.get_webhook_logs("user-1", event_type="run_completed")
+
+        assert [log["log_id"] for log in logs] == ["user-1-log-04", "user-1-log-02", "user-1-log-00"]
+        assert all(log["event_type"] == "run_completed" for log in logs)
+
+    @pytest.mark.asyncio
+    async def test_filter_by_status(self, test_db):
+        """Should only return the user's logs with the given status."""
+        await self.insert_mixed_logs(test_db)
+        service = NotificationService()
+
+        logs = await service.get_webhook_logs("user-1", status="failed")
+
+        assert [log["log_id"] for log in logs] == ["user-1-log-05", "user-1-log-02", "user-1-log-01"]
+        assert all(log["status"] == "failed" for log in logs)
+
+    @pytest.mark.asyncio
+    async def test_filter_by_event_type_and_status(self, test_db):
+        """Should combine both filters."""
+        await self.insert_mixed_logs(test_db)
+        service = NotificationService()
+
+        logs = await service.get_webhook_logs("user-1", event_type="run_completed", status="success")
+
+        assert [log["log_id"] for log in logs] == ["user-1-log-04", "user-1-log-00"]
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages_filtered_logs(self, test_db):
+        """Paging with a cursor should stay within the filter."""
+        await self.insert_mixed_logs(test_db)
+        service = NotificationService()
+
+        first = await service.get_webhook_logs("user-1", limit=2, status="failed")
+        second = await service.get_webhook_logs(
+            "user-1", limit=2, status="failed", cursor=first[-1]["log_id"]
+        )
+
+        assert [log["log_id"] for log in first] == ["user-1-log-05", "user-1-log-02"]
+        assert [log["log_id"] for log in second] == ["user-1-log-01"]
+
+
+def queue_notification(service: NotificationService, run_id: str) -> None:
+    """Queue a completed-run notification."""
+    service.queue_run_notification(
+        user_id="user-1",
+        run_id=run_id,
+        benchmark="mmlu",
+        model="openai/gpt-4o",
+        status="completed",
+        score=0.5,
+    )
+
+
+class TestRunNotificationQueue:
+    """Tests for background delivery of run notifications."""
+
+    @pytest.mark.asyncio
+    async def test_queued_notifications_delivered(self):
+        """Should deliver queued notifications with their arguments."""
+        service = NotificationService()
+        delivered = []
+
+        async def fake_send(**kwargs):
+            delivered.append(kwargs)
+            return True
+
+        service.send_run_notification = fake_send
+        queue_notification(service, "run-1")
+        await service.close()
+
+        assert delivered == [{
+            "user_id": "user-1",
+            "run_id": "run-1",
+            "benchmark": "mmlu",
+            "model": "openai/gpt-4o",
+            "status": "completed",
+            "score": 0.5,
+            "duration_seconds": None,
+            "error": None,
+        }]
+
+    @pytest.mark.asyncio
+    async def test_worker_survives_failed_delivery(self):
+        """A failing delivery should not stop later ones."""
+        service = NotificationService()
+        delivered = []
+
+        async def fake_send(**kwargs):
+            if kwargs["run_id"] == "run-1":
+                raise RuntimeError("boom")
+            delivered.append(kwargs["run_id"])
+            return True
+
+        service.send_run_notification = fake_send
+        for i in range(1, 2 * notifications.NOTIFICATION_WORKERS + 2):
+            queue_notification(service, f"run-{i}")
+        await service.close()
+
+        assert sorted(delivered) == sorted(
+            f"run-{i}" for i in range(2, 2 * notifications.NOTIFICATION_WORKERS + 2)
+        )
+
+    @pytest.mark.asyncio
+    async def test_close_drains_queue(self):
+        """Shutdown should wait for queued notifications to be delivered."""
+        service = NotificationService()
+        delivered = []
+
+        async def slow_send(**kwargs):
+            await asyncio.sleep(0.01)
+            delivered.append(kwargs["run_id"])
+            return True
+
+        service.send_run_notification = slow_send
+        run_ids = [f"run-{i}" for i in range(3 * notifications.NOTIFICATION_WORKERS)]
+        for run_id in run_ids:
+            queue_notification(service, run_id)
+        await service.close()
+
+        assert sorted(delivered) == sorted(run_ids)
+        assert service._workers == []
+
+    @pytest.mark.asyncio
+    async def test_close_logs_dropped_after_timeout(self, monkeypatch, caplog):
+        """Notifications still pending at the drain timeout should be logged as dropped."""
+        monkeypatch.setattr(notifications, "NOTIFICATION_DRAIN_TIMEOUT", 0.05)
+        # Alembic's fileConfig() disables existing loggers when an earlier
+        # test has run the migrations
+        monkeypatch.setattr(notifications.logger, "disabled", False)
+        service = NotificationService()
+        never = asyncio.Event()
+
+        async def stuck_send(**kwargs):
+            await never.wait()
+
+        service.send_run_notification = stuck_send
+        run_ids = [f"run-{i}" for i in range(notifications.NOTIFICATION_WORKERS + 2)]
+        for run_id in run_ids:
+            queue_notification(service, run_id)
+
+        with caplog.at_level(logging.WARNING, logger=notifications.__name__):
+            await service.close()
+
+        dropped = [r.getMessage() for r in caplog.records if "dropped on shutdown" in r.getMessage()]
+        assert sorted(dropped) == sorted(
+            f"Run {run_id}: Webhook notification dropped on shutdown" for run_id in run_ids
+        )
+        assert service._workers == []
+
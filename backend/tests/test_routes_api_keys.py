@@ -219,6 +219,42 @@ class TestListProvidersEndpoint:
         assert "anthropic" in providers
         assert "google" in providers
 
+    @pytest.mark.asyncio
+    async def test_list_providers_matches_predefined(self, client, test_db):
+        """Should return every predefined provider, in definition order."""
+        from app.db.models import PREDEFINED_PROVIDERS
+
+        response = await client.get("/api/api-keys/providers")
+
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == [
+            {
+                "provider": provider_id,
+                "env_var": info["env_var"],
+                "display_name": info["display_name"],
+                "color": info["color"],
+            }
+            for provider_id, info in PREDEFINED_PROVIDERS.items()
+        ]
+
+    @pytest.mark.asyncio
+    async def test_list_providers_conditional_get(self, client, test_db):
+        """Should return 304 when the client's ETag is still current."""
+        response = await client.get("/api/api-keys/providers")
+        etag = response.headers["etag"]
+
+        cached = await client.get(
+            "/api/api-keys/providers", headers={"If-None-Match": etag}
+        )
+        stale = await client.get(
+            "/api/api-keys/providers", headers={"If-None-Match": '"stale"'}
+        )
+
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert stale.status_code == 200
+        assert stale.json() == response.json()
+
     @pytest.mark.asyncio
     async def test_list_providers_no_auth_required(self, client, test_db):
         """Should not require authentication."""
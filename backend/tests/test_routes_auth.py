@@ -9,6 +9,7 @@ Tests cover:
 """
 
 import pytest
+from unittest.mock import patch
 
 
 class TestRegisterEndpoint:
@@ -171,6 +172,20 @@ class TestGetMeEndpoint:
         assert "created_at" in data
         assert data["is_active"] is True
 
+    @pytest.mark.asyncio
+    async def test_get_me_reuses_authenticated_user(self, authenticated_client):
+        """Should not look the user up again for a recently verified token."""
+        from app.services.auth import auth_service
+        client, _ = authenticated_client
+        
+        await client.get("/api/auth/me")
+        with patch.object(auth_service, "get_user_by_id") as get_user_by_id:
+            response = await client.get("/api/auth/me")
+        
+        assert response.status_code == 200
+        assert response.json()["email"] == "testuser@example.com"
+        get_user_by_id.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_me_no_auth(self, client, test_db):
         """Should reject request without authentication."""
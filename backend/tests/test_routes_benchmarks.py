@@ -124,6 +124,67 @@ class TestListBenchmarksEndpoint:
             assert response.status_code == 200
             assert "cache-control" in response.headers
 
+    @pytest.mark.asyncio
+    async def test_list_benchmarks_conditional_get(self, client, test_db):
+        """Should return 304 when the client's ETag is still current."""
+        from app.db.models import Benchmark, BenchmarkRequirements
+        
+        mock_benchmarks = [
+            Benchmark(
+                name="test",
+                category="Test",
+                description_short="Test",
+                tags=[],
+                featured=False,
+                source="test",
+                requirements=BenchmarkRequirements(),
+            )
+        ]
+        
+        with patch('app.api.routes.benchmarks.get_benchmarks',
+                   new=AsyncMock(return_value=mock_benchmarks)):
+            response = await client.get("/api/benchmarks")
+            etag = response.headers["etag"]
+            
+            cached = await client.get(
+                "/api/benchmarks", headers={"If-None-Match": etag}
+            )
+            
+            assert cached.status_code == 304
+            assert cached.content == b""
+            assert cached.headers["etag"] == etag
+
+    @pytest.mark.asyncio
+    async def test_list_benchmarks_gzip(self, client, test_db):
+        """Should serve the precompressed payload only to clients accepting gzip."""
+        from app.db.models import Benchmark, BenchmarkRequirements
+        
+        mock_benchmarks = [
+            Benchmark(
+                name="test",
+                category="Test",
+                description_short="Test",
+                tags=[],
+                featured=False,
+                source="test",
+                requirements=BenchmarkRequirements(),
+            )
+        ]
+        
+        with patch('app.api.routes.benchmarks.get_benchmarks',
+                   new=AsyncMock(return_value=mock_benchmarks)):
+            compressed = await client.get(
+                "/api/benchmarks", headers={"Accept-Encoding": "gzip"}
+            )
+            plain = await client.get(
+                "/api/benchmarks", headers={"Accept-Encoding": "identity"}
+            )
+            
+            assert compressed.headers["content-encoding"] == "gzip"
+            assert "content-encoding" not in plain.headers
+            assert compressed.json() == plain.json()
+            assert compressed.json()[0]["name"] == "test"
+
 
 class TestGetBenchmarkEndpoint:
     """Tests for GET /api/benchmarks/{name} endpoint."""
@@ -3,11 +3,14 @@ Tests for health and version API routes.
 
 Tests cover:
 - Health check endpoint
+- Readiness probe database check sharing
 - Version information endpoint
 """
 
+import asyncio
+
 import pytest
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 
 class TestHealthEndpoint:
@@ -33,6 +36,24 @@ class TestHealthEndpoint:
         
         assert response.status_code == 200
 
+    @pytest.mark.asyncio
+    async def test_health_and_ready_share_database_check(self, client, monkeypatch):
+        """Concurrent probes should trigger a single database check."""
+        import app.api.routes.health as health
+
+        monkeypatch.setattr(health, "_db_check_cache", None)
+        check = AsyncMock(return_value=True)
+
+        with patch("app.api.routes.health.check_database", check):
+            responses = await asyncio.gather(
+                client.get("/api/health"),
+                client.get("/api/ready"),
+                client.get("/api/health"),
+            )
+
+        assert [r.status_code for r in responses] == [200, 200, 200]
+        assert check.await_count == 1
+
 
 class TestVersionEndpoint:
     """Tests for /api/version endpoint."""
@@ -0,0 +1,107 @@
+"""
+Tests for notification routes.
+
+Tests cover:
+- Webhook delivery logs
+- Request body size limit
+"""
+
+import json
+
+import pytest
+
+from app.api.routes.notifications import MAX_BODY_BYTES
+
+
+class TestWebhookLogsEndpoint:
+    """Tests for GET /api/notifications/logs endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_logs_empty(self, authenticated_client):
+        """Should return an empty list when nothing was delivered."""
+        client, _ = authenticated_client
+
+        response = await client.get("/api/notifications/logs")
+
+        assert response.status_code == 200
+        assert response.json() == []
+
+    @pytest.mark.asyncio
+    async def test_logs_invalid_cursor(self, authenticated_client):
+        """Should reject a cursor that is not one of the user's logs."""
+        client, _ = authenticated_client
+
+        response = await client.get("/api/notifications/logs?cursor=unknown-log")
+
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_logs_offset_accepted(self, authenticated_client):
+        """Should keep accepting the deprecated offset parameter."""
+        client, _ = authenticated_client
+
+        response = await client.get("/api/notifications/logs?offset=10")
+
+        assert response.status_code == 200
+        assert response.json() == []
+
+    @pytest.mark.asyncio
+    async def test_logs_no_auth(self, client, test_db):
+        """Should reject request without authentication."""
+        response = await client.get("/api/notifications/logs")
+
+        assert response.status_code == 401
+
+
+async def chunked(body: bytes, chunk_size: int = 1024):
+    """Yield a request body in chunks so it is sent without a Content-Length."""
+    for start in range(0, len(body), chunk_size):
+        yield body[start:start + chunk_size]
+
+
+class TestBodySizeLimit:
+    """Tests for the request body limit on notification routes."""
+
+    @pytest.mark.asyncio
+    async def test_oversized_body_rejected(self, authenticated_client):
+        """Should refuse a body whose Content-Length is over the limit."""
+        client, _ = authenticated_client
+        body = json.dumps({"webhook_url": "https://example.com/" + "a" * MAX_BODY_BYTES})
+
+        response = await client.patch(
+            "/api/notifications/settings",
+            content=body,
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 413
+
+    @pytest.mark.asyncio
+    async def test_oversized_chunked_body_rejected(self, authenticated_client):
+        """Should refuse an oversized body sent without a Content-Length."""
+        client, _ = authenticated_client
+        body = json.dumps({"webhook_url": "https://example.com/" + "a" * MAX_BODY_BYTES}).encode()
+
+        response = await client.patch(
+            "/api/notifications/settings",
+            content=chunked(body),
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 413
+
+    @pytest.mark.asyncio
+    async def test_small_chunked_body_accepted(self, authenticated_client):
+        """Should still parse a small body sent without a Content-Length."""
+        client, _ = authenticated_client
+        body = json.dumps({"webhook_enabled": True}).encode()
+
+        response = await client.patch(
+            "/api/notifications/settings",
+            content=chunked(body, chunk_size=4),
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["webhook_enabled"] is True
+
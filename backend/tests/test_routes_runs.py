@@ -12,6 +12,8 @@ Tests cover:
 - Update run notes
 - Duplicate run
 - Scheduled runs
+- Run event stream
+- Eval data stream
 """
 
 import pytest
@@ -595,3 +597,167 @@ class TestScheduledRunsEndpoints:
         assert response.status_code == 200
         data = response.json()
         assert isinstance(data, list)
+
+
+class TestRunEventsEndpoint:
+    """Tests for GET /api/runs/{run_id}/events endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_events_send_whole_log_of_finished_run(self, client, test_db, tmp_path, monkeypatch):
+        """Should stream logs larger than one read before the final event."""
+        import json
+        import app.api.routes.runs as runs_routes
+        from app.api.routes.runs import MAX_TAIL_BYTES
+        from app.db.models import RunCreate, RunStatus
+        from app.services.run_store import run_store
+        
+        monkeypatch.setattr(runs_routes, "RUNS_DIR", tmp_path)
+        run = await run_store.create_run(RunCreate(benchmark="mmlu", model="model"))
+        await run_store.update_run(run.run_id, status=RunStatus.COMPLETED, exit_code=0)
+        
+        lines = [f"line {i:06d} " + "x" * 80 for i in range(2 * MAX_TAIL_BYTES // 80)]
+        (tmp_path / run.run_id).mkdir()
+        (tmp_path / run.run_id / "stdout.log").write_text("\n".join(lines) + "\n")
+        (tmp_path / run.run_id / "stderr.log").write_text("warning\n")
+        
+        response = await client.get(f"/api/runs/{run.run_id}/events")
+        
+        assert response.status_code == 200
+        events = [
+            (block.split("\n")[0][len("event: "):], json.loads(block.split("\n")[1][len("data: "):]))
+            for block in response.text.split("\n\n") if block
+        ]
+        streamed = [data["line"] for name, data in events if name == "log_line" and data["stream"] == "stdout"]
+        assert streamed == lines
+        assert ("log_line", {"stream": "stderr", "line": "warning"}) in events
+        assert events[-1][0] == "completed"
+
+
+def make_fake_eval_log(total_samples: int):
+    """Build a stand-in for an inspect_ai eval log header and its samples."""
+    from types import SimpleNamespace
+    
+    header = SimpleNamespace(
+        status="success",
+        eval=SimpleNamespace(
+            task="mmlu",
+            model="openai/gpt-4o",
+            dataset=None,
+            created="2026-01-01T00:00:00",
+            completed=None,
+            config=SimpleNamespace(limit=None, epochs=1),
+        ),
+        results=SimpleNamespace(total_samples=total_samples, scores=[]),
+        samples=None,
+    )
+    samples = [
+        SimpleNamespace(
+            id=i,
+            epoch=1,
+            input=f"question {i}",
+            target="A",
+            error=None,
+            messages=[SimpleNamespace(content="A")],
+            scores=None,
+        )
+        for i in range(total_samples)
+    ]
+    return header, samples
+
+
+class TestStreamEvalDataEndpoint:
+    """Tests for GET /api/runs/{run_id}/eval-data/{eval_path}/stream endpoint."""
+
+    @pytest.fixture
+    async def eval_run(self, test_db, tmp_path, monkeypatch):
+        """Create a run whose artifacts live in a temporary directory."""
+        import app.api.routes.runs as runs_routes
+        from app.db.models import RunCreate
+        from app.services.run_store import run_store
+        
+        monkeypatch.setattr(runs_routes, "_RUNS_DIR_REAL", tmp_path)
+        run = await run_store.create_run(RunCreate(benchmark="mmlu", model="openai/gpt-4o"))
+        (tmp_path / run.run_id / "logs").mkdir(parents=True)
+        return run.run_id, tmp_path / run.run_id
+
+    @pytest.mark.asyncio
+    async def test_stream_metadata_then_samples(self, client, eval_run):
+        """Should send the metadata line followed by one line per sample."""
+        import json
+        from app.api.routes.runs import EVAL_STREAM_BATCH_SIZE
+        
+        run_id, run_dir = eval_run
+        (run_dir / "logs" / "result.eval").write_bytes(b"eval")
+        total = EVAL_STREAM_BATCH_SIZE * 2 + 3
+        header, samples = make_fake_eval_log(total)
+        
+        with patch("inspect_ai.log.read_eval_log", return_value=header), \
+                patch("inspect_ai.log.read_eval_log_samples", return_value=iter(samples)):
+            response = await client.get(f"/api/runs/{run_id}/eval-data/logs/result.eval/stream")
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines[0]["eval_name"] == "mmlu"
+        assert lines[0]["total_samples"] == total
+        assert "samples" not in lines[0]
+        assert [line["id"] for line in lines[1:]] == list(range(total))
+        assert lines[1]["input"] == "question 0"
+        assert lines[1]["output"] == "A"
+
+    @pytest.mark.asyncio
+    async def test_stream_rejects_non_eval_file(self, client, eval_run):
+        """Should refuse to parse files that are not .eval logs."""
+        run_id, run_dir = eval_run
+        (run_dir / "stdout.log").write_text("output\n")
+        
+        response = await client.get(f"/api/runs/{run_id}/eval-data/stdout.log/stream")
+        
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_stream_rejects_path_traversal(self, client, eval_run):
+        """Should refuse paths that resolve outside the run directory."""
+        run_id, run_dir = eval_run
+        (run_dir.parent / "other.eval").write_bytes(b"eval")
+        
+        response = await client.get(f"/api/runs/{run_id}/eval-data/..%2Fother.eval/stream")
+        
+        assert response.status_code == 403
+
+
+class TestCloseEvalSamples:
+    """Tests for closing an eval sample reader from a worker thread."""
+
+    @pytest.mark.asyncio
+    async def test_close_waits_for_pending_batch(self):
+        """Closing while a batch is being read should wait for it, not fail."""
+        import asyncio
+        import threading
+        from app.api.routes.runs import _close_samples, _next_samples
+        
+        reading = threading.Event()
+        release = threading.Event()
+        closed = []
+        
+        def slow_samples():
+            try:
+                reading.set()
+                release.wait(5)
+                yield "sample"
+                yield "sample"
+            finally:
+                closed.append(True)
+        
+        samples = slow_samples()
+        lock = threading.Lock()
+        loop = asyncio.get_running_loop()
+        batch = loop.run_in_executor(None, _next_samples, samples, 1, lock)
+        await loop.run_in_executor(None, reading.wait, 5)
+        close = loop.run_in_executor(None, _close_samples, samples, lock)
+        release.set()
+        
+        assert await batch == ["sample"]
+        await close
+        assert closed == [True]
+
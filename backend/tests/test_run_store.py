@@ -19,7 +19,7 @@ import pytest
 os.environ["OPENBENCH_SECRET_KEY"] = "test-secret-key-for-testing-only-32"
 os.environ["OPENBENCH_ENCRYPTION_KEY"] = "test-encryption-key-32-chars-xxx"
 
-from app.services.run_store import RunStore
+from app.services.run_store import DeleteResult, RunStore
 from app.db.models import RunCreate, RunStatus
 
 
@@ -321,6 +321,37 @@ class TestRunDeletion:
         assert result is False
         assert await run_store.get_run(run.run_id) is not None
 
+    @pytest.mark.asyncio
+    async def test_try_delete_reports_outcome(self, test_db):
+        """Should tell deleted, running and missing runs apart."""
+        run_store = RunStore()
+        done = await run_store.create_run(RunCreate(benchmark="mmlu", model="gpt-4"), user_id="user-1")
+        running = await run_store.create_run(RunCreate(benchmark="mmlu", model="gpt-4"), user_id="user-1")
+        await run_store.update_run(running.run_id, status=RunStatus.RUNNING)
+        
+        assert await run_store.try_delete(done.run_id, user_id="user-2") == DeleteResult.NOT_FOUND
+        assert await run_store.try_delete(running.run_id, user_id="user-1") == DeleteResult.RUNNING
+        assert await run_store.try_delete(done.run_id, user_id="user-1") == DeleteResult.DELETED
+        assert await run_store.try_delete(done.run_id, user_id="user-1") == DeleteResult.NOT_FOUND
+        assert await run_store.get_run(running.run_id) is not None
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_skips_running_and_missing(self, test_db):
+        """Should delete only existing, non-running runs in one call."""
+        run_store = RunStore()
+        done = await run_store.create_run(RunCreate(benchmark="mmlu", model="gpt-4"))
+        running = await run_store.create_run(RunCreate(benchmark="mmlu", model="gpt-4"))
+        await run_store.update_run(running.run_id, status=RunStatus.RUNNING)
+        run_ids = [done.run_id, running.run_id, "nonexistent-id"]
+
+        statuses = await run_store.get_run_statuses(run_ids)
+        deleted = await run_store.bulk_delete(run_ids)
+
+        assert statuses == {done.run_id: RunStatus.QUEUED, running.run_id: RunStatus.RUNNING}
+        assert deleted == {done.run_id}
+        assert await run_store.get_run(done.run_id) is None
+        assert await run_store.get_run(running.run_id) is not None
+
 
 class TestRunTags:
     """Tests for run tag management."""
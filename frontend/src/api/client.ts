@@ -997,8 +997,10 @@ class ApiClient {
     }, true);
   }
 
-  async getNotificationLogs(limit: number = 50, offset: number = 0): Promise<NotificationLog[]> {
-    return this.request<NotificationLog[]>(`/notifications/logs?limit=${limit}&offset=${offset}`, {}, true);
+  async getNotificationLogs(limit: number = 50, cursor?: string): Promise<NotificationLog[]> {
+    const params = new URLSearchParams({ limit: String(limit) });
+    if (cursor) params.set('cursor', cursor);
+    return this.request<NotificationLog[]>(`/notifications/logs?${params}`, {}, true);
   }
 
   async testWebhook(webhookUrl: string): Promise<WebhookTestResponse> {